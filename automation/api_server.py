@@ -6,29 +6,134 @@ for integration with the PHP frontend.
 """
 
 import os
-from flask import Flask, jsonify, request
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Any, Callable, Optional
+
+import orjson
+from flask import Flask, Response, request
 from flask_cors import CORS
 
 # Import local modules
+from cache import MemoryCache
 from config import get_config, setup_logging
 from scraper import get_scraper, IngredientProfile, PubChemData
 
 app = Flask(__name__)
-CORS(app)  # Enable CORS for PHP frontend
 
 logger = setup_logging()
 
+# The PHP frontend calls this API server-side (api-functions/
+# ingredient_autosearch.php), so CORS is only needed when browsers call it
+# directly. Enable it for the data endpoints and the listed origins only;
+# health/readiness probes skip the CORS machinery entirely.
+_cors_origins = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "").split(",")
+    if origin.strip()
+]
+if _cors_origins:
+    CORS(
+        app,
+        resources={r"/(search|enrich)(/.*)?": {"origins": _cors_origins}},
+        max_age=86400,  # Let browsers cache preflights for a day
+    )
+
+# Maximum number of names accepted by the batch endpoints
+MAX_BATCH_SIZE = 50
+
+# Shared worker pool for fanning out I/O-bound scraper calls
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="scraper")
+
+# Separate pool for per-name batch work; batch items submit their source
+# lookups to `_executor`, so sharing one pool could deadlock
+_batch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="batch")
+
+# Background enrichment jobs ("async": true); results are kept for an hour
+_job_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="job")
+_jobs = MemoryCache(max_entries=10000, ttl_seconds=3600)
+
+# Scraped source data keyed by normalized ingredient name, so repeat
+# searches skip TGSC/PubChem entirely. /enrich deliberately bypasses it:
+# each call must write to the database, and its lookups are already served
+# by the scraper's response cache.
+_search_cache = MemoryCache(
+    max_entries=2048,
+    ttl_seconds=get_config().scraper.cache_ttl_hours * 3600,
+)
+
+
+# Set once the database has answered; /ready reports 503 until then
+_db_ready = threading.Event()
+
+
+def _warm_database() -> None:
+    """Create the DB adapter and fill its pool at boot, off the request path."""
+    try:
+        from db_adapter import get_db
+        
+        db = get_db()
+        db.warm_pool()
+        _db_ready.set()
+    except Exception as e:
+        logger.warning(f"Database warm-up failed, will retry on /ready: {e}")
+
+
+# Runs in the background so a slow or down database doesn't block boot
+threading.Thread(target=_warm_database, name="db-warmup", daemon=True).start()
+
+
+def json_response(payload: dict, status: int = 200) -> Response:
+    """Serialize a payload with orjson (faster than flask.jsonify)."""
+    return Response(
+        orjson.dumps(payload),
+        status=status,
+        mimetype="application/json",
+    )
+
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for Docker/K8s."""
-    return jsonify({
+    return json_response({
         "status": "healthy",
         "service": "parfum-automation-api",
         "version": "1.0.0"
     })
 
 
+@app.route('/ready', methods=['GET'])
+def readiness_check():
+    """Readiness probe: 503 until the database connection is usable."""
+    if not _db_ready.is_set():
+        from db_adapter import get_db
+        
+        if get_db().test_connection():
+            _db_ready.set()
+    
+    if not _db_ready.is_set():
+        return json_response({"status": "unavailable", "database": False}, 503)
+    
+    return json_response({"status": "ready", "database": True})
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Connection pool and cache statistics for capacity tuning."""
+    from db_adapter import get_db
+    
+    return json_response({
+        "db_pool": get_db().pool_status(),
+        "search_cache": {
+            "entries": len(_search_cache),
+            "hits": _search_cache.hits,
+            "misses": _search_cache.misses,
+        },
+    })
+
+
 @app.route('/search', methods=['GET'])
 def search_ingredient():
     """
@@ -36,6 +141,7 @@ def search_ingredient():
     
     Query Parameters:
         name (str): Ingredient name to search for
+        refresh (bool): Forget cached results and "not found" answers first
         
     Returns:
         JSON with combined data from TGSC and PubChem
@@ -43,47 +149,157 @@ def search_ingredient():
     name = request.args.get('name', '').strip()
     
     if not name:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": "Missing 'name' parameter"
-        }), 400
+        }, 400)
     
     logger.info(f"API search request for: {name}")
     
-    try:
-        scraper = get_scraper()
+    if request.args.get('refresh', '').lower() in ('1', 'true'):
+        _search_cache.delete(name.lower())
+        get_scraper().forget_misses(name)
+    
+    payload, status, cache_hit = _search_one(name)
+    
+    response = json_response(payload, status)
+    response.headers["X-Cache"] = "HIT" if cache_hit else "MISS"
+    return response
+
+
+@app.route('/search/batch', methods=['POST'])
+def search_batch():
+    """
+    Search for several ingredients in one request.
+    
+    Body (JSON):
+        names (list[str]): Ingredient names to search for
         
-        # Search TGSC first (fragrance-specific data)
-        tgsc_data = scraper.search_tgsc(name)
+    Returns:
+        JSON with one result per name, in request order. Each result
+        carries its own "status" so partial failures don't fail the batch.
+    """
+    names, error = _parse_batch_names(request.get_json(silent=True))
+    if error:
+        return json_response({"success": False, "error": error}, 400)
+    
+    logger.info(f"API batch search request for {len(names)} ingredients")
+    
+    results = []
+    for name, (payload, status, _) in zip(
+        names, _batch_executor.map(_search_one, names)
+    ):
+        results.append({"name": name, "status": status, **payload})
+    
+    return json_response({"success": True, "results": results})
+
+
+def _search_one(name: str) -> tuple[dict, int, bool]:
+    """
+    Search TGSC and PubChem for a single ingredient.
+    
+    Returns:
+        Tuple of (response payload, HTTP status, served from cache)
+    """
+    try:
+        cache_key = name.lower()
+        cache_enabled = get_config().scraper.cache_enabled
+        cached = _search_cache.get(cache_key) if cache_enabled else None
         
-        # Search PubChem (chemical data)
-        pubchem_data = scraper.search_pubchem(name)
+        if cached:
+            tgsc_data, pubchem_data = cached
+        else:
+            scraper = get_scraper()
+            
+            # Query TGSC (fragrance data) and PubChem (chemical data) concurrently
+            # so the request waits for the slower source instead of both in turn
+            tgsc_future = _executor.submit(scraper.search_tgsc, name)
+            pubchem_future = _executor.submit(scraper.search_pubchem, name)
+            
+            tgsc_data = tgsc_future.result()
+            pubchem_data = pubchem_future.result()
+            
+            if cache_enabled and (tgsc_data or pubchem_data):
+                _search_cache.set(cache_key, (tgsc_data, pubchem_data))
         
         if not tgsc_data and not pubchem_data:
-            return jsonify({
+            return {
                 "success": False,
                 "error": f"No data found for '{name}'",
                 "searched_sources": ["TGSC", "PubChem"]
-            }), 404
+            }, 404, False
         
         # Merge data from both sources
         result = merge_ingredient_data(name, tgsc_data, pubchem_data)
         
-        return jsonify({
+        return {
             "success": True,
             "ingredient": result,
             "sources": {
                 "tgsc": tgsc_data is not None,
                 "pubchem": pubchem_data is not None
             }
-        })
+        }, 200, cached is not None
         
     except Exception as e:
         logger.error(f"API search error for '{name}': {e}")
-        return jsonify({
+        return {
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500, False
+
+
+def _parse_batch_names(data: Optional[dict]) -> tuple[list[str], Optional[str]]:
+    """
+    Validate a batch request body.
+    
+    Returns:
+        Tuple of (cleaned names, error message or None)
+    """
+    if not data or not isinstance(data.get('names'), list):
+        return [], "Missing 'names' list in request body"
+    
+    names = [
+        n.strip() for n in data['names']
+        if isinstance(n, str) and n.strip()
+    ]
+    
+    if not names:
+        return [], "No valid ingredient names in 'names'"
+    
+    if len(names) > MAX_BATCH_SIZE:
+        return [], f"Too many names (max {MAX_BATCH_SIZE} per batch)"
+    
+    return names, None
+
+
+# (source attribute getter, result key) pairs copied by merge_ingredient_data
+# when the source value is truthy; built once instead of per request
+_TGSC_FIELD_MAP = tuple((attrgetter(attr), key) for attr, key in (
+    ("cas", "cas"),
+    ("odor_description", "odor_description"),
+    ("odor_family", "odor_family"),
+    ("molecular_formula", "formula"),
+    ("molecular_weight", "molecular_weight"),
+    ("flash_point", "flash_point"),
+    ("tenacity", "tenacity"),
+    ("logp", "logp"),
+    ("soluble", "solubility"),
+    ("shelf_life", "shelf_life"),
+    ("einecs", "einecs"),
+    ("reach", "reach"),
+    ("appearance", "appearance"),
+    ("odor_strength", "odor_strength"),
+    ("fema", "fema"),
+))
+
+_PUBCHEM_FIELD_MAP = tuple((attrgetter(attr), key) for attr, key in (
+    ("cas", "cas"),
+    ("molecular_formula", "formula"),
+    ("molecular_weight", "molecular_weight"),
+    ("iupac_name", "iupac_name"),
+    ("cid", "cid"),
+))
 
 
 def merge_ingredient_data(
@@ -129,61 +345,27 @@ def merge_ingredient_data(
     # Merge TGSC data
     if tgsc:
         result["sources"].append("TGSC")
-        if tgsc.cas:
-            result["cas"] = tgsc.cas
-        if tgsc.odor_description:
-            result["odor_description"] = tgsc.odor_description
-        if tgsc.odor_family:
-            result["odor_family"] = tgsc.odor_family
-        if tgsc.molecular_formula:
-            result["formula"] = tgsc.molecular_formula
-        if tgsc.molecular_weight:
-            result["molecular_weight"] = tgsc.molecular_weight
-        if tgsc.flash_point:
-            result["flash_point"] = tgsc.flash_point
-        if tgsc.tenacity:
-            result["tenacity"] = tgsc.tenacity
-        if tgsc.logp:
-            result["logp"] = tgsc.logp
-        if tgsc.soluble:
-            result["solubility"] = tgsc.soluble
-        if tgsc.shelf_life:
-            result["shelf_life"] = tgsc.shelf_life
-        if tgsc.einecs:
-            result["einecs"] = tgsc.einecs
-        if tgsc.reach:
-            result["reach"] = tgsc.reach
-            
+        for get_value, key in _TGSC_FIELD_MAP:
+            value = get_value(tgsc)
+            if value:
+                result[key] = value
+        
         if tgsc.appearance:
-            result["appearance"] = tgsc.appearance
             # Simple heuristic for state
-            if "solid" in tgsc.appearance.lower() or "crystal" in tgsc.appearance.lower() or "powder" in tgsc.appearance.lower():
+            appearance = tgsc.appearance.lower()
+            if "solid" in appearance or "crystal" in appearance or "powder" in appearance:
                 result["physical_state"] = 2 # Solid
-            elif "liquid" in tgsc.appearance.lower() or "oil" in tgsc.appearance.lower():
+            elif "liquid" in appearance or "oil" in appearance:
                 result["physical_state"] = 1 # Liquid
-        if tgsc.odor_strength:
-            result["odor_strength"] = tgsc.odor_strength
-            
-            
-        # Check for FEMA in uses
-        for use in tgsc.uses:
-            if use.startswith("FEMA"):
-                result["fema"] = use
-                break
     
-    # Merge PubChem data (higher priority for chemical data)
+    # Merge PubChem data (higher priority for chemical data, so it
+    # overrides TGSC's cas/formula/weight)
     if pubchem:
         result["sources"].append("PubChem")
-        if pubchem.cas:
-            result["cas"] = pubchem.cas  # Override with PubChem CAS
-        if pubchem.molecular_formula:
-            result["formula"] = pubchem.molecular_formula
-        if pubchem.molecular_weight:
-            result["molecular_weight"] = pubchem.molecular_weight
-        if pubchem.iupac_name:
-            result["iupac_name"] = pubchem.iupac_name
-        if pubchem.cid:
-            result["cid"] = pubchem.cid
+        for get_value, key in _PUBCHEM_FIELD_MAP:
+            value = get_value(pubchem)
+            if value:
+                result[key] = value
         if pubchem.synonyms:
             result["synonyms"] = pubchem.synonyms[:10]  # Limit to 10
     
@@ -200,6 +382,8 @@ def enrich_and_save():
     Body (JSON):
         name (str): Ingredient name
         owner_id (str): Database owner ID (optional)
+        async (bool): Run in the background and return 202 with a job_id
+                      to poll at /jobs/<job_id> (optional)
         
     Returns:
         JSON with saved ingredient data
@@ -207,16 +391,134 @@ def enrich_and_save():
     data = request.get_json()
     
     if not data or 'name' not in data:
-        return jsonify({
+        return json_response({
             "success": False,
             "error": "Missing 'name' in request body"
-        }), 400
+        }, 400)
     
     name = data['name'].strip()
     owner_id = data.get('owner_id', '1')
     
     logger.info(f"API enrich request for: {name}")
     
+    if data.get('async'):
+        return _accepted(_submit_job(_enrich_one, name, owner_id))
+    
+    payload, status = _enrich_one(name, owner_id)
+    return json_response(payload, status)
+
+
+@app.route('/enrich/batch', methods=['POST'])
+def enrich_batch():
+    """
+    Search, enrich, and save several ingredients in one request.
+    
+    Body (JSON):
+        names (list[str]): Ingredient names
+        owner_id (str): Database owner ID (optional)
+        async (bool): Run in the background and return 202 with a job_id
+                      to poll at /jobs/<job_id> (optional)
+        
+    Returns:
+        JSON with one result per name, in request order. Each result
+        carries its own "status" so partial failures don't fail the batch.
+    """
+    data = request.get_json(silent=True)
+    names, error = _parse_batch_names(data)
+    if error:
+        return json_response({"success": False, "error": error}, 400)
+    
+    owner_id = data.get('owner_id', '1')
+    
+    logger.info(f"API batch enrich request for {len(names)} ingredients")
+    
+    if data.get('async'):
+        return _accepted(_submit_job(_enrich_many, names, owner_id))
+    
+    payload, status = _enrich_many(names, owner_id)
+    return json_response(payload, status)
+
+
+def _enrich_many(names: list[str], owner_id: str) -> tuple[dict, int]:
+    """
+    Enrich and save several ingredients concurrently.
+    
+    Returns:
+        Tuple of (response payload, HTTP status)
+    """
+    results = []
+    for name, (payload, status) in zip(
+        names, _batch_executor.map(lambda n: _enrich_one(n, owner_id), names)
+    ):
+        results.append({"name": name, "status": status, **payload})
+    
+    return {"success": True, "results": results}, 200
+
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id: str):
+    """
+    Poll a background enrichment job.
+    
+    Returns:
+        JSON with the job "status" (queued/running/finished). Finished
+        jobs include the "result" payload the synchronous call would
+        have returned and its "http_status".
+    """
+    job = _jobs.get(job_id)
+    
+    if job is None:
+        return json_response({
+            "success": False,
+            "error": f"Unknown or expired job '{job_id}'"
+        }, 404)
+    
+    return json_response({"success": True, **job})
+
+
+def _submit_job(
+    func: Callable[..., tuple[dict, int]],
+    *args: Any
+) -> str:
+    """
+    Run a (payload, status) handler on the job pool.
+    
+    Returns:
+        Job ID for /jobs/<job_id>
+    """
+    job_id = uuid.uuid4().hex
+    job = {"job_id": job_id, "status": "queued"}
+    _jobs.set(job_id, job)
+    
+    def run() -> None:
+        job["status"] = "running"
+        try:
+            payload, status = func(*args)
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}")
+            payload, status = {"success": False, "error": str(e)}, 500
+        job.update(status="finished", http_status=status, result=payload)
+    
+    _job_executor.submit(run)
+    return job_id
+
+
+def _accepted(job_id: str) -> Response:
+    """202 response pointing the client at a job's status URL."""
+    return json_response({
+        "success": True,
+        "job_id": job_id,
+        "status_url": f"/jobs/{job_id}"
+    }, 202)
+
+
+def _enrich_one(name: str, owner_id: str) -> tuple[dict, int]:
+    """
+    Enrich and save a single ingredient.
+    
+    Returns:
+        Tuple of (response payload, HTTP status)
+    """
     try:
         # Import enrichment module
         from enrichment import enrich_ingredient
@@ -226,27 +528,32 @@ def enrich_and_save():
         result = enrich_ingredient(name, owner_id=owner_id, db=db)
         
         if result.success:
-            return jsonify({
+            if result.skipped:
+                action = "skipped"  # Already fully populated
+            else:
+                action = "created" if result.was_created else "updated"
+            
+            return {
                 "success": True,
-                "action": result.action,
+                "action": action,
                 "ingredient": {
                     "name": name,
-                    "fields": result.fields_populated,
+                    "fields": result.updated_fields,
                     "sources": result.sources_used
                 }
-            })
+            }, 200
         else:
-            return jsonify({
+            return {
                 "success": False,
-                "error": result.error
-            }), 500
+                "error": result.error_message
+            }, 500
             
     except Exception as e:
         logger.error(f"API enrich error for '{name}': {e}")
-        return jsonify({
+        return {
             "success": False,
             "error": str(e)
-        }), 500
+        }, 500
 
 
 if __name__ == '__main__':
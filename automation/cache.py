@@ -0,0 +1,76 @@
+"""
+In-process caching utilities for ParfumVault Automation.
+
+Bounded LRU caches with per-entry expiry, safe to share between the
+API server's worker threads.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class MemoryCache:
+    """
+    Thread-safe LRU cache with a time-to-live per entry.
+
+    Entries expire `ttl_seconds` after they were stored; once `max_entries`
+    is reached the least recently used entry is evicted.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value, or None if missing or expired."""
+        with self._lock:
+            item = self._data.get(key)
+
+            if item is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = item
+            if time.monotonic() >= expires_at:
+                del self._data[key]  # Expired
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl_seconds: Optional[float] = None
+    ) -> None:
+        """Cache a value, evicting the least recently used entry if full."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a cached value if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
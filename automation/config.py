@@ -4,10 +4,10 @@ Configuration management for ParfumVault Data Auto-Population Module.
 Environment variables with sensible defaults for Docker deployment.
 """
 
+import functools
 import os
 import logging
 from dataclasses import dataclass
-from typing import Optional
 
 
 @dataclass
@@ -19,6 +19,11 @@ class DatabaseConfig:
     database: str
     port: int = 3306
     charset: str = "utf8mb4"
+    # Connection pool sizing; match to API worker threads x concurrent batches
+    pool_size: int = 25
+    max_overflow: int = 25
+    pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
+    pool_timeout: int = 10  # Seconds to wait for a free pooled connection
     
     @property
     def connection_url(self) -> str:
@@ -39,6 +44,9 @@ class ScraperConfig:
     enable_user_agent_rotation: bool = True
     cache_enabled: bool = True
     cache_ttl_hours: int = 24
+    bulk_concurrency: int = 4  # Ingredients enriched in parallel by bulk runs
+    host_concurrency: int = 4  # Requests in flight per host without its own limit
+    fuzzy_aliases: bool = True  # Match misspelled names to known aliases
 
 
 @dataclass
@@ -59,6 +67,10 @@ class AppConfig:
             password=os.getenv("DB_PASS", "pvault"),
             database=os.getenv("DB_NAME", "pvault"),
             port=int(os.getenv("DB_PORT", "3306")),
+            pool_size=int(os.getenv("DB_POOL_SIZE", "25")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "25")),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+            pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "10")),
         )
         
         scraper_config = ScraperConfig(
@@ -68,6 +80,9 @@ class AppConfig:
             enable_user_agent_rotation=os.getenv("USER_AGENT_ROTATION", "true").lower() == "true",
             cache_enabled=os.getenv("CACHE_ENABLED", "true").lower() == "true",
             cache_ttl_hours=int(os.getenv("CACHE_TTL_HOURS", "24")),
+            bulk_concurrency=int(os.getenv("ENRICH_CONCURRENCY", "4")),
+            host_concurrency=int(os.getenv("SCRAPER_HOST_CONCURRENCY", "4")),
+            fuzzy_aliases=os.getenv("FUZZY_ALIASES", "true").lower() == "true",
         )
         
         return cls(
@@ -79,36 +94,47 @@ class AppConfig:
         )
 
 
+LOGGER_NAME = "parfum_automation"
+
+
 def setup_logging(level: str = "INFO") -> logging.Logger:
-    """Configure logging for Docker stdout output."""
+    """
+    Configure logging for Docker stdout output.
+    
+    Safe to call repeatedly: the root handler is only installed once,
+    later calls just adjust the package logger's level.
+    """
     log_level = getattr(logging, level.upper(), logging.INFO)
     
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[logging.StreamHandler()],
-    )
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=log_level,
+            format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+            handlers=[logging.StreamHandler()],
+        )
     
-    logger = logging.getLogger("parfum_automation")
+    logger = logging.getLogger(LOGGER_NAME)
     logger.setLevel(log_level)
     
     return logger
 
 
-# Global configuration instance
-_config: Optional[AppConfig] = None
-
-
+@functools.cache
 def get_config() -> AppConfig:
     """Get or create the global configuration instance."""
-    global _config
-    if _config is None:
-        _config = AppConfig.from_environment()
-    return _config
+    return AppConfig.from_environment()
 
 
+@functools.cache
 def get_logger() -> logging.Logger:
-    """Get the configured logger instance."""
-    config = get_config()
-    return setup_logging(config.log_level)
+    """
+    Get the package logger, configuring it from LOG_LEVEL on first use.
+    
+    A level already set via setup_logging() (e.g. the CLI's --verbose)
+    is kept.
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    if logger.level == logging.NOTSET:
+        return setup_logging(get_config().log_level)
+    return logger
@@ -6,16 +6,86 @@ the existing PHP application's database state.
 """
 
 import logging
-from contextlib import contextmanager
-from typing import Any, Generator, Optional
+import threading
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from typing import Any, Generator, Iterable, Literal, Optional
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import and_, case, create_engine, func, inspect, or_, select, text, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session, sessionmaker
 
-from config import get_config, get_logger
+from config import get_config, LOGGER_NAME
 from models import Base, Ingredient, IFRALibrary, Synonym, IngCategory
 
 
+def _fillable_columns(model: type[Base], protected: set[str]) -> frozenset[str]:
+    """Mapped column attributes of a model that upserts may write."""
+    return frozenset(attr.key for attr in inspect(model).column_attrs) - protected
+
+
+# Columns an upsert may update, computed once per model
+INGREDIENT_FILLABLE = _fillable_columns(
+    Ingredient, {"id", "name", "owner_id", "created_at"}
+)
+IFRA_FILLABLE = _fillable_columns(IFRALibrary, {"id", "owner_id"})
+
+# Number of locks that record keys are hashed onto for upsert serialization
+UPSERT_LOCK_STRIPES = 64
+
+# Maximum keys per IN (...) clause when prefetching rows for bulk upserts
+BULK_LOOKUP_CHUNK = 500
+
+# IFRA category limit columns shared by `ingredients` and `IFRALibrary`
+IFRA_LIMIT_COLUMNS: tuple[str, ...] = (
+    "cat1", "cat2", "cat3", "cat4", "cat5A", "cat5B", "cat5C", "cat5D",
+    "cat6", "cat7A", "cat7B", "cat8", "cat9", "cat10A", "cat10B",
+    "cat11A", "cat11B", "cat12",
+)
+
+
+def _apply_updates(
+    existing: Base,
+    data: dict[str, Any],
+    fillable: frozenset[str],
+    fill_missing_only: bool
+) -> list[str]:
+    """
+    Copy non-None values from `data` onto an existing ORM instance.
+    
+    Args:
+        existing: Persistent instance to update
+        data: Candidate field values
+        fillable: Column names that may be written
+        fill_missing_only: If True, only populate NULL/empty fields
+                           (100.0 counts as empty for IFRA limits)
+    
+    Returns:
+        Names of the fields that were updated
+    """
+    # One snapshot of loaded values instead of a descriptor call per field
+    current = inspect(existing).dict
+    updated_fields = []
+    
+    for key, value in data.items():
+        if value is None or key not in fillable:
+            continue
+        
+        if fill_missing_only:
+            current_value = current[key] if key in current else getattr(existing, key)
+            is_empty = (
+                current_value is None or 
+                current_value == "" or
+                (isinstance(current_value, float) and current_value == 100.0)
+            )
+            if not is_empty:
+                continue
+        
+        setattr(existing, key, value)
+        updated_fields.append(key)
+    
+    return updated_fields
+
+
 class DatabaseAdapter:
     """
     Safe database connection handler for ParfumVault.
@@ -24,16 +94,26 @@ class DatabaseAdapter:
     - Connection pooling for efficiency
     - Context manager for automatic cleanup
     - Safe upsert that preserves user customizations
+    
+    Name lookups use plain equality: the ParfumVault tables use a
+    case-insensitive (`_ci`) collation, so `name = ?` matches regardless
+    of case and, unlike `LOWER(name) LIKE LOWER(?)`, can use the index
+    on `name`.
     """
     
     def __init__(self) -> None:
         self.config = get_config()
-        self.logger = get_logger()
+        self.logger = logging.getLogger(f"{LOGGER_NAME}.db")
+        
+        db_config = self.config.db
         
         self.engine = create_engine(
-            self.config.db.connection_url,
-            pool_size=5,
-            max_overflow=10,
+            db_config.connection_url,
+            pool_size=db_config.pool_size,
+            max_overflow=db_config.max_overflow,
+            pool_recycle=db_config.pool_recycle,
+            pool_timeout=db_config.pool_timeout,
+            pool_use_lifo=True,  # Reuse the most recent (warm) connection first
             pool_pre_ping=True,  # Verify connections before use
             echo=self.config.log_level == "DEBUG",
         )
@@ -44,6 +124,9 @@ class DatabaseAdapter:
             autoflush=False,
         )
         
+        # Striped re-entrant locks serializing find-or-create per record key
+        self._upsert_locks = [threading.RLock() for _ in range(UPSERT_LOCK_STRIPES)]
+        
         self.logger.info(f"Database adapter initialized for {self.config.db.host}")
     
     @contextmanager
@@ -53,7 +136,7 @@ class DatabaseAdapter:
         
         Usage:
             with db.session() as session:
-                result = session.query(Ingredient).all()
+                result = session.scalars(select(Ingredient)).all()
         """
         session = self.SessionLocal()
         try:
@@ -66,6 +149,103 @@ class DatabaseAdapter:
         finally:
             session.close()
     
+    @contextmanager
+    def _session_scope(
+        self,
+        session: Optional[Session] = None
+    ) -> Generator[Session, None, None]:
+        """
+        Use the caller's session if given, otherwise open (and commit) one.
+        
+        Lets a caller run several adapter operations in one transaction
+        instead of paying a pool checkout and commit per call.
+        """
+        if session is not None:
+            yield session
+        else:
+            with self.session() as owned:
+                yield owned
+    
+    @contextmanager
+    def record_lock(self, *key: str) -> Generator[None, None, None]:
+        """
+        Serialize find-or-create for one record key within this process.
+        
+        The ParfumVault schema has no unique (owner_id, name) keys, so
+        SELECT-then-INSERT is the only safe upsert; without this two
+        concurrent enrichments of the same name could both insert. Hold
+        the lock until the transaction commits.
+        
+        Usage:
+            with db.ingredient_lock(name, owner), db.session() as session:
+                db.upsert_ingredient(data, owner_id=owner, session=session)
+        """
+        with self._upsert_locks[self._lock_stripe(key)]:
+            yield
+    
+    @contextmanager
+    def record_locks(self, *keys: tuple[str, ...]) -> Generator[None, None, None]:
+        """
+        Hold the record locks for several keys at once (see record_lock).
+        
+        For records matched on more than one column. Stripes are taken in
+        index order, so two callers sharing stripes can't deadlock.
+        """
+        with ExitStack() as stack:
+            for stripe in sorted({self._lock_stripe(key) for key in keys}):
+                stack.enter_context(self._upsert_locks[stripe])
+            yield
+    
+    @staticmethod
+    def _lock_stripe(key: tuple[str, ...]) -> int:
+        """Index of the lock stripe guarding a record key."""
+        return hash(tuple(k.lower() for k in key)) % UPSERT_LOCK_STRIPES
+    
+    def ingredient_lock(
+        self,
+        name: str,
+        owner_id: Optional[str] = None
+    ) -> AbstractContextManager[None]:
+        """Record lock for an ingredient and its synonyms (see record_lock)."""
+        owner = owner_id or self.config.owner_id
+        return self.record_lock("ingredients", owner, name.strip())
+    
+    def pool_status(self) -> dict[str, Any]:
+        """Connection pool usage, for sizing DB_POOL_SIZE/DB_MAX_OVERFLOW."""
+        pool = self.engine.pool
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "status": pool.status(),
+        }
+    
+    def warm_pool(self, connections: Optional[int] = None) -> int:
+        """
+        Open pooled connections up front so early requests skip the
+        MySQL TCP + auth handshake.
+        
+        Args:
+            connections: Number to open (defaults to the pool size)
+        
+        Returns:
+            Number of connections opened
+        """
+        count = min(connections or self.config.db.pool_size, self.config.db.pool_size)
+        
+        # Hold them all at once, otherwise the pool just reuses the first one
+        opened = []
+        try:
+            for _ in range(count):
+                opened.append(self.engine.connect())
+        finally:
+            for conn in opened:
+                conn.close()
+        
+        self.logger.info(f"Warmed database pool with {len(opened)} connections")
+        return len(opened)
+    
     def test_connection(self) -> bool:
         """Test database connectivity."""
         try:
@@ -84,7 +264,9 @@ class DatabaseAdapter:
     def get_ingredient_by_name(
         self, 
         name: str, 
-        owner_id: Optional[str] = None
+        owner_id: Optional[str] = None,
+        *,
+        session: Optional[Session] = None
     ) -> Optional[Ingredient]:
         """
         Case-insensitive ingredient lookup by name.
@@ -92,26 +274,31 @@ class DatabaseAdapter:
         Args:
             name: Ingredient name to search for
             owner_id: Optional owner filter (uses default if not provided)
+            session: Optional session to run in (committed by the caller)
         
         Returns:
             Ingredient instance or None if not found
         """
         owner = owner_id or self.config.owner_id
         
-        with self.session() as session:
-            result = session.query(Ingredient).filter(
-                Ingredient.name.ilike(name),
-                Ingredient.owner_id == owner
+        with self._session_scope(session) as s:
+            result = s.scalars(
+                select(Ingredient).where(
+                    Ingredient.name == name,
+                    Ingredient.owner_id == owner
+                ).limit(1)
             ).first()
             
-            if result:
-                session.expunge(result)
+            if result and session is None:
+                s.expunge(result)
             return result
     
     def get_ingredient_by_cas(
         self, 
         cas: str, 
-        owner_id: Optional[str] = None
+        owner_id: Optional[str] = None,
+        *,
+        session: Optional[Session] = None
     ) -> Optional[Ingredient]:
         """
         Lookup ingredient by CAS number.
@@ -119,26 +306,95 @@ class DatabaseAdapter:
         Args:
             cas: CAS registry number (e.g., "8007-75-8")
             owner_id: Optional owner filter
+            session: Optional session to run in (committed by the caller)
         
         Returns:
             Ingredient instance or None if not found
         """
         owner = owner_id or self.config.owner_id
         
-        with self.session() as session:
-            result = session.query(Ingredient).filter(
-                Ingredient.cas == cas,
-                Ingredient.owner_id == owner
+        with self._session_scope(session) as s:
+            result = s.scalars(
+                select(Ingredient).where(
+                    Ingredient.cas == cas,
+                    Ingredient.owner_id == owner
+                ).limit(1)
             ).first()
             
-            if result:
-                session.expunge(result)
+            if result and session is None:
+                s.expunge(result)
             return result
     
+    def get_ingredient_fields(
+        self,
+        name: str,
+        fields: tuple[str, ...],
+        owner_id: Optional[str] = None,
+        *,
+        session: Optional[Session] = None
+    ) -> Optional[Row]:
+        """
+        Fetch selected columns of an ingredient without loading the ORM object.
+        
+        Args:
+            name: Ingredient name to search for
+            fields: Ingredient column names to return (e.g. ("cas", "formula"))
+            owner_id: Optional owner filter (uses default if not provided)
+            session: Optional session to run in (committed by the caller)
+        
+        Returns:
+            Named row with the requested fields, or None if not found
+        """
+        owner = owner_id or self.config.owner_id
+        columns = [getattr(Ingredient, f) for f in fields]
+        
+        with self._session_scope(session) as s:
+            return s.execute(
+                select(*columns).where(
+                    Ingredient.name == name,
+                    Ingredient.owner_id == owner
+                ).limit(1)
+            ).first()
+    
+    def get_ingredients_fields(
+        self,
+        names: Iterable[str],
+        fields: tuple[str, ...],
+        owner_id: Optional[str] = None,
+        *,
+        session: Optional[Session] = None
+    ) -> dict[str, Row]:
+        """
+        Fetch selected columns of many ingredients with chunked IN (...) queries.
+        
+        Returns:
+            Mapping of lowercase ingredient name to a named row holding
+            "name" plus the requested fields
+        """
+        owner = owner_id or self.config.owner_id
+        values = list({name for name in names if name})
+        columns = [Ingredient.name, *(getattr(Ingredient, f) for f in fields)]
+        rows_by_name: dict[str, Row] = {}
+        
+        with self._session_scope(session) as s:
+            for i in range(0, len(values), BULK_LOOKUP_CHUNK):
+                rows = s.execute(
+                    select(*columns).where(
+                        Ingredient.name.in_(values[i:i + BULK_LOOKUP_CHUNK]),
+                        Ingredient.owner_id == owner
+                    )
+                )
+                for row in rows:
+                    rows_by_name.setdefault(row.name.lower(), row)
+            
+            return rows_by_name
+    
     def get_all_ingredients(
         self, 
         owner_id: Optional[str] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        *,
+        session: Optional[Session] = None
     ) -> list[Ingredient]:
         """
         Get all ingredients for an owner.
@@ -146,29 +402,99 @@ class DatabaseAdapter:
         Args:
             owner_id: Owner filter (uses default if not provided)
             limit: Maximum number of results
+            session: Optional session to run in (committed by the caller)
         
         Returns:
             List of Ingredient instances
         """
         owner = owner_id or self.config.owner_id
         
-        with self.session() as session:
-            query = session.query(Ingredient).filter(
-                Ingredient.owner_id == owner
-            )
+        with self._session_scope(session) as s:
+            stmt = select(Ingredient).where(Ingredient.owner_id == owner)
             if limit:
-                query = query.limit(limit)
+                stmt = stmt.limit(limit)
             
-            results = query.all()
-            for r in results:
-                session.expunge(r)
+            results = list(s.scalars(stmt))
+            if session is None:
+                for r in results:
+                    s.expunge(r)
             return results
     
+    def get_ingredient_cas_pairs(
+        self,
+        owner_id: Optional[str] = None,
+        require_cas: bool = False,
+        *,
+        session: Optional[Session] = None
+    ) -> list[Row]:
+        """
+        Get (id, name, cas) for all ingredients of an owner.
+        
+        A lean alternative to get_all_ingredients() for callers that only
+        match on CAS: no ORM instances are built for the ~50-column rows.
+        
+        Args:
+            owner_id: Owner filter (uses default if not provided)
+            require_cas: Only return ingredients with a non-empty CAS
+            session: Optional session to run in (committed by the caller)
+        
+        Returns:
+            Rows with `id`, `name` and `cas` attributes
+        """
+        owner = owner_id or self.config.owner_id
+        
+        stmt = select(Ingredient.id, Ingredient.name, Ingredient.cas).where(
+            Ingredient.owner_id == owner
+        )
+        if require_cas:
+            stmt = stmt.where(Ingredient.cas.is_not(None), Ingredient.cas != "")
+        
+        with self._session_scope(session) as s:
+            return list(s.execute(stmt))
+    
+    def get_ingredient_stats(
+        self,
+        owner_id: Optional[str] = None,
+        *,
+        session: Optional[Session] = None
+    ) -> dict[str, int]:
+        """
+        Count an owner's ingredients, and those with a CAS number / profile.
+        
+        One aggregate query instead of loading every ingredient.
+        
+        Returns:
+            Dictionary with counts: total, with_cas, with_profile
+        """
+        owner = owner_id or self.config.owner_id
+        
+        def populated(column: Any) -> Any:
+            # SUM over no rows is NULL, hence the COALESCE
+            is_set = and_(column.is_not(None), column != "")
+            return func.coalesce(func.sum(case((is_set, 1), else_=0)), 0)
+        
+        with self._session_scope(session) as s:
+            total, with_cas, with_profile = s.execute(
+                select(
+                    func.count(),
+                    populated(Ingredient.cas),
+                    populated(Ingredient.profile),
+                ).select_from(Ingredient).where(Ingredient.owner_id == owner)
+            ).one()
+        
+        return {
+            "total": int(total),
+            "with_cas": int(with_cas),
+            "with_profile": int(with_profile),
+        }
+    
     def upsert_ingredient(
         self,
         ingredient_data: dict[str, Any],
         fill_missing_only: bool = True,
-        owner_id: Optional[str] = None
+        owner_id: Optional[str] = None,
+        *,
+        session: Optional[Session] = None
     ) -> tuple[Ingredient, bool]:
         """
         Insert or update an ingredient with safety checks.
@@ -178,6 +504,7 @@ class DatabaseAdapter:
             fill_missing_only: If True, only populate NULL/empty fields
                              (preserves user customizations)
             owner_id: Owner ID for the ingredient
+            session: Optional session to run in (committed by the caller)
         
         Returns:
             Tuple of (Ingredient, was_created)
@@ -188,41 +515,23 @@ class DatabaseAdapter:
         if not name:
             raise ValueError("Ingredient name is required")
         
-        with self.session() as session:
+        with (
+            self.ingredient_lock(name, owner),
+            self._session_scope(session) as s,
+        ):
             # Try to find existing ingredient
-            existing = session.query(Ingredient).filter(
-                Ingredient.name.ilike(name),
-                Ingredient.owner_id == owner
+            existing = s.scalars(
+                select(Ingredient).where(
+                    Ingredient.name == name,
+                    Ingredient.owner_id == owner
+                ).limit(1)
             ).first()
             
             if existing:
                 # Update existing ingredient
-                updated_fields = []
-                
-                for key, value in ingredient_data.items():
-                    if key in ("id", "name", "owner_id", "created_at"):
-                        continue  # Skip protected fields
-                    
-                    if not hasattr(existing, key):
-                        continue  # Skip unknown fields
-                    
-                    current_value = getattr(existing, key)
-                    
-                    if fill_missing_only:
-                        # Only update if current value is None or empty
-                        is_empty = (
-                            current_value is None or 
-                            current_value == "" or
-                            (isinstance(current_value, float) and current_value == 100.0)
-                        )
-                        if is_empty and value is not None:
-                            setattr(existing, key, value)
-                            updated_fields.append(key)
-                    else:
-                        # Always update
-                        if value is not None:
-                            setattr(existing, key, value)
-                            updated_fields.append(key)
+                updated_fields = _apply_updates(
+                    existing, ingredient_data, INGREDIENT_FILLABLE, fill_missing_only
+                )
                 
                 if updated_fields:
                     self.logger.info(
@@ -231,20 +540,80 @@ class DatabaseAdapter:
                 else:
                     self.logger.debug(f"No updates needed for '{name}'")
                 
-                session.expunge(existing)
+                if session is None:
+                    s.expunge(existing)
                 return existing, False
             
             else:
                 # Create new ingredient
                 ingredient_data["owner_id"] = owner
                 new_ingredient = Ingredient(**ingredient_data)
-                session.add(new_ingredient)
-                session.flush()
+                s.add(new_ingredient)
+                s.flush()
                 
                 self.logger.info(f"Created new ingredient: {name}")
-                session.expunge(new_ingredient)
+                if session is None:
+                    s.expunge(new_ingredient)
                 return new_ingredient, True
     
+    def bulk_update_ingredients(
+        self,
+        updates: list[dict[str, Any]],
+        fill_missing_only: bool = True,
+        owner_id: Optional[str] = None,
+        batch_size: int = 500,
+        *,
+        session: Optional[Session] = None
+    ) -> int:
+        """
+        Update many existing ingredients, matched by name, in one transaction.
+        
+        Ingredients are prefetched with chunked IN (...) queries and the
+        changes flushed in batches, instead of a find-and-update round trip
+        per ingredient. Names with no matching ingredient are ignored.
+        
+        Args:
+            updates: Ingredient field dictionaries, each with a "name"
+            fill_missing_only: If True, only populate NULL/empty fields
+            owner_id: Owner ID of the ingredients
+            batch_size: Ingredients written per flush
+            session: Optional session to run in (committed by the caller)
+        
+        Returns:
+            Number of ingredients matched
+        """
+        owner = owner_id or self.config.owner_id
+        names = list({data["name"] for data in updates if data.get("name")})
+        matched = 0
+        
+        with self._session_scope(session) as s:
+            by_name: dict[str, Ingredient] = {}
+            for i in range(0, len(names), BULK_LOOKUP_CHUNK):
+                rows = s.scalars(
+                    select(Ingredient).where(
+                        Ingredient.name.in_(names[i:i + BULK_LOOKUP_CHUNK]),
+                        Ingredient.owner_id == owner
+                    )
+                )
+                for row in rows:
+                    by_name.setdefault(row.name.lower(), row)
+            
+            for data in updates:
+                existing = by_name.get((data.get("name") or "").lower())
+                if existing is None:
+                    continue
+                
+                _apply_updates(existing, data, INGREDIENT_FILLABLE, fill_missing_only)
+                matched += 1
+                
+                if matched % batch_size == 0:
+                    s.flush()
+            
+            s.flush()
+        
+        self.logger.info(f"Bulk ingredient update: {matched} matched")
+        return matched
+    
     # -------------------------------------------------------------------------
     # IFRA Library Operations
     # -------------------------------------------------------------------------
@@ -252,44 +621,87 @@ class DatabaseAdapter:
     def get_ifra_entry_by_cas(
         self, 
         cas: str, 
-        owner_id: Optional[str] = None
+        owner_id: Optional[str] = None,
+        *,
+        session: Optional[Session] = None
     ) -> Optional[IFRALibrary]:
         """Lookup IFRA entry by CAS number."""
         owner = owner_id or self.config.owner_id
         
-        with self.session() as session:
-            result = session.query(IFRALibrary).filter(
-                IFRALibrary.cas == cas,
-                IFRALibrary.owner_id == owner
+        with self._session_scope(session) as s:
+            result = s.scalars(
+                select(IFRALibrary).where(
+                    IFRALibrary.cas == cas,
+                    IFRALibrary.owner_id == owner
+                ).limit(1)
             ).first()
             
-            if result:
-                session.expunge(result)
+            if result and session is None:
+                s.expunge(result)
             return result
     
+    def get_ifra_entries_by_cas(
+        self,
+        cas_values: Iterable[str],
+        owner_id: Optional[str] = None,
+        *,
+        session: Optional[Session] = None
+    ) -> dict[str, IFRALibrary]:
+        """
+        Lookup IFRA entries for many CAS numbers with chunked IN (...) queries.
+        
+        Returns:
+            Mapping of lowercase CAS number to IFRA entry
+        """
+        owner = owner_id or self.config.owner_id
+        values = list({cas.strip() for cas in cas_values if cas and cas.strip()})
+        entries: dict[str, IFRALibrary] = {}
+        
+        with self._session_scope(session) as s:
+            for i in range(0, len(values), BULK_LOOKUP_CHUNK):
+                rows = s.scalars(
+                    select(IFRALibrary).where(
+                        IFRALibrary.cas.in_(values[i:i + BULK_LOOKUP_CHUNK]),
+                        IFRALibrary.owner_id == owner
+                    )
+                )
+                for row in rows:
+                    entries.setdefault(row.cas.lower(), row)
+            
+            if session is None:
+                for entry in entries.values():
+                    s.expunge(entry)
+            return entries
+    
     def get_ifra_entry_by_name(
         self, 
         name: str, 
-        owner_id: Optional[str] = None
+        owner_id: Optional[str] = None,
+        *,
+        session: Optional[Session] = None
     ) -> Optional[IFRALibrary]:
         """Lookup IFRA entry by name."""
         owner = owner_id or self.config.owner_id
         
-        with self.session() as session:
-            result = session.query(IFRALibrary).filter(
-                IFRALibrary.name.ilike(name),
-                IFRALibrary.owner_id == owner
+        with self._session_scope(session) as s:
+            result = s.scalars(
+                select(IFRALibrary).where(
+                    IFRALibrary.name == name,
+                    IFRALibrary.owner_id == owner
+                ).limit(1)
             ).first()
             
-            if result:
-                session.expunge(result)
+            if result and session is None:
+                s.expunge(result)
             return result
     
     def upsert_ifra_entry(
         self,
         ifra_data: dict[str, Any],
         fill_missing_only: bool = True,
-        owner_id: Optional[str] = None
+        owner_id: Optional[str] = None,
+        *,
+        session: Optional[Session] = None
     ) -> tuple[IFRALibrary, bool]:
         """
         Insert or update IFRA library entry.
@@ -298,78 +710,267 @@ class DatabaseAdapter:
             ifra_data: Dictionary of IFRA fields
             fill_missing_only: If True, only populate NULL fields
             owner_id: Owner ID for the entry
+            session: Optional session to run in (committed by the caller)
         
         Returns:
             Tuple of (IFRALibrary, was_created)
         """
         owner = owner_id or self.config.owner_id
-        cas = ifra_data.get("cas", "").strip()
-        name = ifra_data.get("name", "").strip()
+        cas = (ifra_data.get("cas") or "").strip()
+        name = (ifra_data.get("name") or "").strip()
         
         if not cas and not name:
             raise ValueError("Either CAS or name is required for IFRA entry")
         
-        with self.session() as session:
+        # Matched by CAS, then by name: lock both, so rows sharing either
+        # one (e.g. the same name under two CAS numbers) can't both insert
+        lock_keys = [("IFRALibrary", owner, "cas", cas), ("IFRALibrary", owner, "name", name)]
+        with (
+            self.record_locks(*(key for key in lock_keys if key[-1])),
+            self._session_scope(session) as s,
+        ):
             # Try to find existing entry by CAS first, then by name
             existing = None
             if cas:
-                existing = session.query(IFRALibrary).filter(
-                    IFRALibrary.cas == cas,
-                    IFRALibrary.owner_id == owner
+                existing = s.scalars(
+                    select(IFRALibrary).where(
+                        IFRALibrary.cas == cas,
+                        IFRALibrary.owner_id == owner
+                    ).limit(1)
                 ).first()
             
             if not existing and name:
-                existing = session.query(IFRALibrary).filter(
-                    IFRALibrary.name.ilike(name),
-                    IFRALibrary.owner_id == owner
+                existing = s.scalars(
+                    select(IFRALibrary).where(
+                        IFRALibrary.name == name,
+                        IFRALibrary.owner_id == owner
+                    ).limit(1)
                 ).first()
             
             if existing:
                 # Update existing entry
-                updated_fields = []
-                
-                for key, value in ifra_data.items():
-                    if key in ("id", "owner_id"):
-                        continue
-                    
-                    if not hasattr(existing, key):
-                        continue
-                    
-                    current_value = getattr(existing, key)
-                    
-                    if fill_missing_only:
-                        is_empty = (
-                            current_value is None or 
-                            current_value == "" or
-                            (isinstance(current_value, float) and current_value == 100.0)
-                        )
-                        if is_empty and value is not None:
-                            setattr(existing, key, value)
-                            updated_fields.append(key)
-                    else:
-                        if value is not None:
-                            setattr(existing, key, value)
-                            updated_fields.append(key)
+                updated_fields = _apply_updates(
+                    existing, ifra_data, IFRA_FILLABLE, fill_missing_only
+                )
                 
                 if updated_fields:
                     self.logger.info(
                         f"Updated IFRA entry '{name or cas}': {', '.join(updated_fields)}"
                     )
                 
-                session.expunge(existing)
+                if session is None:
+                    s.expunge(existing)
                 return existing, False
             
             else:
                 # Create new entry
                 ifra_data["owner_id"] = owner
                 new_entry = IFRALibrary(**ifra_data)
-                session.add(new_entry)
-                session.flush()
+                s.add(new_entry)
+                s.flush()
                 
                 self.logger.info(f"Created new IFRA entry: {name or cas}")
-                session.expunge(new_entry)
+                if session is None:
+                    s.expunge(new_entry)
                 return new_entry, True
     
+    def count_ifra_entries(
+        self,
+        owner_id: Optional[str] = None,
+        *,
+        session: Optional[Session] = None
+    ) -> int:
+        """Number of IFRA library entries for an owner."""
+        owner = owner_id or self.config.owner_id
+        
+        with self._session_scope(session) as s:
+            return s.scalar(
+                select(func.count()).select_from(IFRALibrary).where(
+                    IFRALibrary.owner_id == owner
+                )
+            )
+    
+    def bulk_upsert_ifra_entries(
+        self,
+        entries: list[dict[str, Any]],
+        fill_missing_only: bool = True,
+        owner_id: Optional[str] = None,
+        batch_size: int = 500,
+        *,
+        optimize: Literal["auto", "new"] = "auto",
+        session: Optional[Session] = None
+    ) -> tuple[int, int]:
+        """
+        Insert or update many IFRA library entries in one transaction.
+        
+        Same matching rules as upsert_ifra_entry (CAS first, then name),
+        but existing rows are prefetched with a few IN (...) queries and
+        all writes are flushed together instead of one round trip per row.
+        Entries matching an earlier entry in the same batch update it.
+        
+        Args:
+            entries: IFRA field dictionaries (see IFRAEntry.to_dict)
+            fill_missing_only: If True, only populate NULL fields
+            owner_id: Owner ID for the entries
+            batch_size: Rows written per flush
+            optimize: "new" when the caller knows none of the entries exist
+                      yet (e.g. an empty library): skips the prefetch
+                      queries and goes straight to INSERTs
+            session: Optional session to run in (committed by the caller)
+        
+        Returns:
+            Tuple of (inserted, updated) counts; entries with neither
+            CAS nor name are ignored
+        """
+        owner = owner_id or self.config.owner_id
+        
+        keyed = []
+        for data in entries:
+            cas = (data.get("cas") or "").strip()
+            name = (data.get("name") or "").strip()
+            if cas or name:
+                keyed.append((cas, name, data))
+        
+        cas_values = list({cas for cas, _, _ in keyed if cas})
+        name_values = list({name for _, name, _ in keyed if name})
+        inserted = updated = 0
+        
+        with self._session_scope(session) as s:
+            # Lowercased keys mirror the case-insensitive column collation
+            by_cas: dict[str, IFRALibrary] = {}
+            by_name: dict[str, IFRALibrary] = {}
+            
+            prefetch = () if optimize == "new" else (
+                (IFRALibrary.cas, cas_values),
+                (IFRALibrary.name, name_values),
+            )
+            
+            for column, values in prefetch:
+                for i in range(0, len(values), BULK_LOOKUP_CHUNK):
+                    rows = s.scalars(
+                        select(IFRALibrary).where(
+                            column.in_(values[i:i + BULK_LOOKUP_CHUNK]),
+                            IFRALibrary.owner_id == owner
+                        )
+                    )
+                    for row in rows:
+                        if row.cas:
+                            by_cas.setdefault(row.cas.lower(), row)
+                        if row.name:
+                            by_name.setdefault(row.name.lower(), row)
+            
+            for cas, name, data in keyed:
+                existing = (cas and by_cas.get(cas.lower())) or (
+                    name and by_name.get(name.lower())
+                )
+                
+                if existing:
+                    _apply_updates(existing, data, IFRA_FILLABLE, fill_missing_only)
+                    updated += 1
+                else:
+                    new_entry = IFRALibrary(
+                        **{k: v for k, v in data.items() if k in IFRA_FILLABLE},
+                        owner_id=owner
+                    )
+                    s.add(new_entry)
+                    inserted += 1
+                    
+                    if cas:
+                        by_cas[cas.lower()] = new_entry
+                    if name:
+                        by_name.setdefault(name.lower(), new_entry)
+                
+                # Send pending rows in batches (multi-row INSERTs / grouped
+                # UPDATEs) rather than one huge flush at commit
+                if (inserted + updated) % batch_size == 0:
+                    s.flush()
+            
+            s.flush()
+        
+        self.logger.info(
+            f"Bulk IFRA upsert: {inserted} inserted, {updated} updated"
+        )
+        return inserted, updated
+    
+    def update_ingredient_ifra_limits(
+        self,
+        owner_id: Optional[str] = None,
+        *,
+        session: Optional[Session] = None
+    ) -> dict[str, int]:
+        """
+        Copy IFRA category limits onto ingredients with a matching CAS.
+        
+        Runs as one multi-table UPDATE ... JOIN on the server. Like the
+        fill-missing-only upsert, a limit is only written where the
+        ingredient's value is NULL or the 100.0 default, and NULL library
+        limits are ignored.
+        
+        Args:
+            owner_id: Owner ID of both the ingredients and the library
+            session: Optional session to run in (committed by the caller)
+        
+        Returns:
+            Dictionary with counts: matched, updated (ingredients with at
+            least one limit changed), skipped
+        """
+        owner = owner_id or self.config.owner_id
+        
+        join_condition = and_(
+            Ingredient.cas == IFRALibrary.cas,
+            Ingredient.cas != "",
+            Ingredient.owner_id == owner,
+            IFRALibrary.owner_id == owner,
+        )
+        
+        limits = {}
+        changes = []
+        for column in IFRA_LIMIT_COLUMNS:
+            current = getattr(Ingredient, column)
+            library = getattr(IFRALibrary, column)
+            fillable = or_(current.is_(None), current == 100.0)
+            limits[column] = case(
+                (fillable, func.coalesce(library, current)),
+                else_=current,
+            )
+            # The CASE above writes a different value for this column
+            changes.append(and_(
+                fillable,
+                library.is_not(None),
+                or_(current.is_(None), library != current),
+            ))
+        
+        with self._session_scope(session) as s:
+            total = s.scalar(
+                select(func.count()).select_from(Ingredient).where(
+                    Ingredient.owner_id == owner
+                )
+            )
+            matched = s.scalar(
+                select(func.count(func.distinct(Ingredient.id))).where(join_condition)
+            )
+            # Counted up front: MySQL connections use CLIENT_FOUND_ROWS, so
+            # the UPDATE's rowcount is rows matched, not rows changed
+            updated = s.scalar(
+                select(func.count(func.distinct(Ingredient.id))).where(
+                    join_condition, or_(*changes)
+                )
+            )
+            s.execute(
+                update(Ingredient)
+                .where(join_condition)
+                .values(limits)
+                .execution_options(synchronize_session=False)
+            )
+        
+        counts = {
+            "matched": matched,
+            "updated": updated,
+            "skipped": total - matched,
+        }
+        self.logger.info(f"IFRA limits SQL update: {counts}")
+        return counts
+    
     # -------------------------------------------------------------------------
     # Synonym Operations
     # -------------------------------------------------------------------------
@@ -380,21 +981,29 @@ class DatabaseAdapter:
         synonym: str,
         source: Optional[str] = None,
         cid: Optional[int] = None,
-        owner_id: Optional[str] = None
+        owner_id: Optional[str] = None,
+        *,
+        session: Optional[Session] = None
     ) -> Synonym:
         """Add a synonym for an ingredient."""
         owner = owner_id or self.config.owner_id
         
-        with self.session() as session:
+        with (
+            self.ingredient_lock(ingredient_name, owner),
+            self._session_scope(session) as s,
+        ):
             # Check if synonym already exists
-            existing = session.query(Synonym).filter(
-                Synonym.ing == ingredient_name,
-                Synonym.synonym == synonym,
-                Synonym.owner_id == owner
+            existing = s.scalars(
+                select(Synonym).where(
+                    Synonym.ing == ingredient_name,
+                    Synonym.synonym == synonym,
+                    Synonym.owner_id == owner
+                ).limit(1)
             ).first()
             
             if existing:
-                session.expunge(existing)
+                if session is None:
+                    s.expunge(existing)
                 return existing
             
             new_synonym = Synonym(
@@ -404,11 +1013,12 @@ class DatabaseAdapter:
                 cid=cid,
                 owner_id=owner
             )
-            session.add(new_synonym)
-            session.flush()
+            s.add(new_synonym)
+            s.flush()
             
             self.logger.debug(f"Added synonym '{synonym}' for '{ingredient_name}'")
-            session.expunge(new_synonym)
+            if session is None:
+                s.expunge(new_synonym)
             return new_synonym
     
     # -------------------------------------------------------------------------
@@ -419,19 +1029,27 @@ class DatabaseAdapter:
         self,
         name: str,
         notes: Optional[str] = None,
-        owner_id: Optional[str] = None
+        owner_id: Optional[str] = None,
+        *,
+        session: Optional[Session] = None
     ) -> tuple[IngCategory, bool]:
         """Get or create an ingredient category."""
         owner = owner_id or self.config.owner_id
         
-        with self.session() as session:
-            existing = session.query(IngCategory).filter(
-                IngCategory.name.ilike(name),
-                IngCategory.owner_id == owner
+        with (
+            self.record_lock("ingCategory", owner, name),
+            self._session_scope(session) as s,
+        ):
+            existing = s.scalars(
+                select(IngCategory).where(
+                    IngCategory.name == name,
+                    IngCategory.owner_id == owner
+                ).limit(1)
             ).first()
             
             if existing:
-                session.expunge(existing)
+                if session is None:
+                    s.expunge(existing)
                 return existing, False
             
             new_category = IngCategory(
@@ -439,21 +1057,27 @@ class DatabaseAdapter:
                 notes=notes,
                 owner_id=owner
             )
-            session.add(new_category)
-            session.flush()
+            s.add(new_category)
+            s.flush()
             
             self.logger.info(f"Created new category: {name}")
-            session.expunge(new_category)
+            if session is None:
+                s.expunge(new_category)
             return new_category, True
 
 
 # Singleton instance
 _db_adapter: Optional[DatabaseAdapter] = None
+_db_adapter_lock = threading.Lock()
 
 
 def get_db() -> DatabaseAdapter:
     """Get or create the global database adapter instance."""
     global _db_adapter
     if _db_adapter is None:
-        _db_adapter = DatabaseAdapter()
+        # The API warms the adapter in a background thread at boot, so
+        # guard against a concurrent first request building a second one
+        with _db_adapter_lock:
+            if _db_adapter is None:
+                _db_adapter = DatabaseAdapter()
     return _db_adapter
@@ -5,9 +5,12 @@ Combines data from multiple sources to enrich ingredient records
 with CAS numbers, odor profiles, IFRA limits, and more.
 """
 
+import functools
+import itertools
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, ClassVar, Iterable, Iterator, Optional
 
 from config import get_config, get_logger
 from db_adapter import get_db, DatabaseAdapter
@@ -19,18 +22,19 @@ from scraper import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class EnrichmentResult:
     """Result of an enrichment operation."""
     ingredient_name: str
     success: bool
     was_created: bool = False
+    skipped: bool = False  # Record already complete, or enriched by an earlier bulk run
     updated_fields: list[str] = field(default_factory=list)
     error_message: Optional[str] = None
     sources_used: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MergedIngredientData:
     """Combined data from multiple sources."""
     name: str
@@ -48,15 +52,18 @@ class MergedIngredientData:
     synonyms: list[str] = field(default_factory=list)
     sources: list[str] = field(default_factory=list)
     
+    # Fields written to the `ingredients` table by to_dict()
+    DB_FIELDS: ClassVar[tuple[str, ...]] = (
+        "name", "cas", "cid", "chemical_name", "formula",
+        "molecularWeight", "profile", "type", "strength",
+        "tenacity", "appearance", "flash_point"
+    )
+    
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for database upsert."""
         result = {}
         
-        for field_name in [
-            "name", "cas", "cid", "chemical_name", "formula",
-            "molecularWeight", "profile", "type", "strength",
-            "tenacity", "appearance", "flash_point"
-        ]:
+        for field_name in self.DB_FIELDS:
             value = getattr(self, field_name)
             if value is not None:
                 result[field_name] = value
@@ -64,6 +71,12 @@ class MergedIngredientData:
         return result
 
 
+# Fields enrichment can fill; a record with all of them set is left alone
+ENRICHABLE_FIELDS: tuple[str, ...] = tuple(
+    f for f in MergedIngredientData.DB_FIELDS if f != "name"
+)
+
+
 # =============================================================================
 # Name Normalization
 # =============================================================================
@@ -92,31 +105,123 @@ INGREDIENT_ALIASES: dict[str, list[str]] = {
     "oud": ["oud oil", "agarwood", "aquilaria"],
 }
 
-# Odor family mappings
-ODOR_FAMILY_MAPPING: dict[str, str] = {
-    "citrus": "Citrus",
-    "woody": "Woody",
-    "floral": "Floral",
-    "oriental": "Oriental",
-    "fresh": "Fresh",
-    "green": "Green",
-    "fruity": "Fruity",
-    "spicy": "Spicy",
-    "balsamic": "Balsamic",
-    "amber": "Amber",
+# Lowercase primary name or alias -> (primary, aliases), built once at import.
+# setdefault keeps the first entry in INGREDIENT_ALIASES order on collisions.
+_ALIAS_LOOKUP: dict[str, tuple[str, tuple[str, ...]]] = {}
+for _primary, _aliases in INGREDIENT_ALIASES.items():
+    _entry = (_primary, tuple(_aliases))
+    _ALIAS_LOOKUP.setdefault(_primary, _entry)
+    for _alias in _aliases:
+        _ALIAS_LOOKUP.setdefault(_alias.lower(), _entry)
+del _primary, _aliases, _entry, _alias
+
+# Common suffixes that may not be in databases
+_NAME_SUFFIXES: tuple[str, ...] = (
+    " essential oil",
+    " absolute",
+    " resinoid", 
+    " concrète",
+    " co2 extract",
+    " oil",
+)
+
+# Single anchored match for any suffix; the leftmost match is the longest
+# suffix (" essential oil" beats " oil")
+_NAME_SUFFIX_RE = re.compile(
+    "(?:" + "|".join(re.escape(suffix) for suffix in _NAME_SUFFIXES) + ")$"
+)
+
+# Names shorter than this are never fuzzy-matched ("oak" is not "oud")
+_FUZZY_MIN_LENGTH = 5
+
+
+class _AliasTrie:
+    """
+    Character trie over alias keys with edit-distance bounded search.
+    
+    Walking the trie shares one Levenshtein DP row per common prefix,
+    so a lookup only explores branches that can still be within
+    `max_edits` instead of comparing against every alias.
+    """
+    
+    __slots__ = ("_root",)
+    
+    def __init__(self, words: Iterable[str]):
+        self._root: dict = {}
+        for word in words:
+            node = self._root
+            for char in word:
+                node = node.setdefault(char, {})
+            node[None] = word  # Terminal marker
+    
+    def search(self, word: str, max_edits: int) -> Optional[str]:
+        """Return the closest stored word within `max_edits`, or None."""
+        best: list = [max_edits + 1, None]
+        first_row = list(range(len(word) + 1))
+        
+        def walk(node: dict, char: str, previous_row: list[int]) -> None:
+            row = [previous_row[0] + 1]
+            for i in range(1, len(word) + 1):
+                row.append(min(
+                    row[i - 1] + 1,  # Insertion
+                    previous_row[i] + 1,  # Deletion
+                    previous_row[i - 1] + (word[i - 1] != char),  # Substitution
+                ))
+            
+            if None in node and row[-1] < best[0]:
+                best[0], best[1] = row[-1], node[None]
+            
+            if min(row) < best[0]:
+                for next_char, child in node.items():
+                    if next_char is not None:
+                        walk(child, next_char, row)
+        
+        for char, child in self._root.items():
+            if char is not None:
+                walk(child, char, first_row)
+        
+        return best[1]
+
+
+_ALIAS_TRIE = _AliasTrie(_ALIAS_LOOKUP)
+
+
+def fuzzy_lookup(name: str, max_edits: int = 1) -> Optional[str]:
+    """
+    Find the known primary name or alias closest to a (misspelled) name.
+    
+    Args:
+        name: Raw ingredient name, e.g. "lavander"
+        max_edits: Maximum Levenshtein distance accepted
+    
+    Returns:
+        The matching lowercase primary name or alias, or None
+    """
+    normalized = name.strip().lower()
+    if len(normalized) < _FUZZY_MIN_LENGTH:
+        return None
+    return _ALIAS_TRIE.search(normalized, max_edits)
+
+
+# Known odor families; display names are the title-cased family
+ODOR_FAMILIES: frozenset[str] = frozenset({
+    "citrus", "woody", "floral", "oriental", "fresh", "green", "fruity",
+    "spicy", "balsamic", "amber", "musk", "aquatic", "marine", "gourmand",
+    "powdery", "leather", "animalic", "herbal", "aromatic", "earthy",
+})
+
+# Families whose display name isn't just family.title()
+_IRREGULAR_ODOR_FAMILIES: dict[str, str] = {
     "musk": "Musky",
-    "aquatic": "Aquatic",
-    "marine": "Marine",
-    "gourmand": "Gourmand",
-    "powdery": "Powdery",
-    "leather": "Leather",
-    "animalic": "Animalic",
-    "herbal": "Herbal",
-    "aromatic": "Aromatic",
-    "earthy": "Earthy",
 }
 
 
+def canonical_odor_family(family: str) -> str:
+    """Display name for an odor family ("citrus" -> "Citrus", "musk" -> "Musky")."""
+    family = family.strip().lower()
+    return _IRREGULAR_ODOR_FAMILIES.get(family, family.title())
+
+
 def normalize_ingredient_name(name: str) -> str:
     """
     Normalize an ingredient name for consistent searching.
@@ -129,34 +234,48 @@ def normalize_ingredient_name(name: str) -> str:
     Returns:
         Normalized name suitable for searching
     """
+    return normalize_ingredient_name_ex(name)[0]
+
+
+@functools.lru_cache(maxsize=8192)
+def normalize_ingredient_name_ex(name: str) -> tuple[str, Optional[tuple[str, ...]]]:
+    """
+    Normalize an ingredient name and report the alias group it matched.
+    
+    Args:
+        name: Raw ingredient name
+    
+    Returns:
+        Tuple of (normalized name, aliases of the matched ingredient or
+        None when the name isn't a known ingredient)
+    """
     # Clean whitespace and lowercase
-    normalized = name.strip().lower()
+    stripped = name.strip()
+    normalized = stripped.lower()
     
     # Remove common suffixes that may not be in databases
-    suffixes_to_remove = [
-        " essential oil",
-        " absolute",
-        " resinoid", 
-        " concrète",
-        " co2 extract",
-        " oil",
-    ]
-    
-    for suffix in suffixes_to_remove:
-        if normalized.endswith(suffix):
-            base_name = normalized[:-len(suffix)].strip()
-            # Return the full version if we have an alias for the base
-            if base_name in INGREDIENT_ALIASES:
-                return INGREDIENT_ALIASES[base_name][0]
-            break
+    suffix_match = _NAME_SUFFIX_RE.search(normalized)
+    if suffix_match:
+        base_name = normalized[:suffix_match.start()].strip()
+        # Return the full version if we have an alias for the base
+        if base_name in INGREDIENT_ALIASES:
+            aliases = _ALIAS_LOOKUP[base_name][1]
+            return aliases[0], aliases
     
     # Check if this is an alias
-    for primary, aliases in INGREDIENT_ALIASES.items():
-        if normalized == primary or normalized in [a.lower() for a in aliases]:
-            # Return the first (preferred) alias
-            return aliases[0]
+    hit = _ALIAS_LOOKUP.get(normalized)
+    
+    # Fall back to the nearest alias for likely misspellings
+    if hit is None and get_config().scraper.fuzzy_aliases:
+        match = fuzzy_lookup(normalized)
+        if match:
+            hit = _ALIAS_LOOKUP[match]
+    
+    if hit:
+        # Return the first (preferred) alias
+        return hit[1][0], hit[1]
     
-    return name.strip()
+    return stripped, None
 
 
 def get_search_variants(name: str) -> list[str]:
@@ -165,30 +284,70 @@ def get_search_variants(name: str) -> list[str]:
     
     Returns multiple forms to try if the first search fails.
     """
-    normalized = normalize_ingredient_name(name)
-    variants = [normalized]
-    
-    # Add the original name if different
-    if name.strip() != normalized:
-        variants.append(name.strip())
-    
-    # Check for aliases
-    name_lower = name.strip().lower()
-    for primary, aliases in INGREDIENT_ALIASES.items():
-        if name_lower == primary or name_lower in [a.lower() for a in aliases]:
-            variants.extend(aliases)
-            break
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_variants = []
-    for v in variants:
-        v_lower = v.lower()
-        if v_lower not in seen:
-            seen.add(v_lower)
-            unique_variants.append(v)
-    
-    return unique_variants[:5]  # Limit to 5 variants
+    return list(_search_variants(name))
+
+
+@functools.lru_cache(maxsize=8192)
+def _search_variants(name: str) -> tuple[str, ...]:
+    """Memoized body of get_search_variants (immutable, so safe to share)."""
+    stripped = name.strip()
+    normalized, aliases = normalize_ingredient_name_ex(stripped)
+    
+    # Normalized name, then the original, then the matched aliases;
+    # case-insensitive dedupe preserving order
+    unique_variants: dict[str, str] = {}
+    for variant in (normalized, stripped, *(aliases or ())):
+        unique_variants.setdefault(variant.lower(), variant)
+    
+    return tuple(unique_variants.values())[:5]  # Limit to 5 variants
+
+
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern:
+    """Compile keywords into one substring-matching alternation."""
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+
+# (pattern, type) rules in priority order: the first group with any
+# keyword in the name wins. Each group is one regex scan of the name
+# instead of a Python-level `in` test per keyword.
+_TYPE_RULES: tuple[tuple[re.Pattern, str], ...] = tuple(
+    (_keyword_pattern(keywords), label) for keywords, label in (
+        # Essential oils typically have these patterns
+        (("essential oil", " eo ", "oil of"), "EO"),
+        # Absolutes and concretes: classify with natural extracts
+        (("absolute", "concrète", "resinoid"), "EO"),
+        # Carriers and solvents
+        (("alcohol", "ethanol", "dpg", "ipm"), "Solvent"),
+        (("fractionated coconut", "jojoba", "carrier"), "Carrier"),
+        # Synthetic musks and aroma chemicals
+        ((
+            "musk", "aldehyde", "ketone", "ester", "acetate",
+            "ionone", "coumarin", "vanillin", "heliotropin"
+        ), "AC"),
+    )
+)
+
+# (pattern, tenacity) rules in priority order, as above
+_TENACITY_RULES: tuple[tuple[re.Pattern, str], ...] = tuple(
+    (_keyword_pattern(keywords), label) for keywords, label in (
+        # Base notes typically have high tenacity
+        ((
+            "musk", "amber", "sandalwood", "vetiver", "patchouli",
+            "oud", "benzoin", "vanilla", "tonka", "labdanum",
+            "cedarwood", "oak", "leather"
+        ), "24+ hours"),
+        # Top notes have low tenacity
+        ((
+            "lemon", "bergamot", "grapefruit", "mandarin", "lime",
+            "eucalyptus", "mint", "basil"
+        ), "2-4 hours"),
+        # Heart notes have medium tenacity
+        ((
+            "rose", "jasmine", "ylang", "geranium", "lavender",
+            "iris", "violet"
+        ), "6-12 hours"),
+    )
+)
 
 
 def infer_ingredient_type(name: str, profile: Optional[str] = None) -> Optional[str]:
@@ -198,32 +357,16 @@ def infer_ingredient_type(name: str, profile: Optional[str] = None) -> Optional[
     Returns one of: AC (Aroma Chemical), EO (Essential Oil), Carrier, Solvent, etc.
     """
     name_lower = name.lower()
-    profile_lower = (profile or "").lower()
-    
-    # Essential oils typically have these patterns
-    if any(kw in name_lower for kw in ["essential oil", " eo ", "oil of"]):
-        return "EO"
     
-    # Absolutes and concretes
-    if any(kw in name_lower for kw in ["absolute", "concrète", "resinoid"]):
-        return "EO"  # Classify with natural extracts
+    for pattern, ingredient_type in _TYPE_RULES:
+        if pattern.search(name_lower):
+            return ingredient_type
     
-    # Carriers and solvents
-    if any(kw in name_lower for kw in ["alcohol", "ethanol", "dpg", "ipm"]):
-        return "Solvent"
-    
-    if any(kw in name_lower for kw in ["fractionated coconut", "jojoba", "carrier"]):
-        return "Carrier"
-    
-    # Synthetic musks and aroma chemicals
-    synthetic_indicators = [
-        "musk", "aldehyde", "ketone", "ester", "acetate",
-        "ionone", "coumarin", "vanillin", "heliotropin"
-    ]
-    if any(kw in name_lower for kw in synthetic_indicators):
-        return "AC"
+    if not profile:
+        return None
     
     # Check profile for clues
+    profile_lower = profile.lower()
     if "synthetic" in profile_lower or "aroma chemical" in profile_lower:
         return "AC"
     
@@ -240,35 +383,10 @@ def infer_tenacity(name: str, profile: Optional[str] = None) -> Optional[str]:
     Returns hours as a string (e.g., "24+ hours", "4-6 hours").
     """
     name_lower = name.lower()
-    profile_lower = (profile or "").lower()
-    
-    # Base notes typically have high tenacity
-    base_note_keywords = [
-        "musk", "amber", "sandalwood", "vetiver", "patchouli",
-        "oud", "benzoin", "vanilla", "tonka", "labdanum",
-        "cedarwood", "oak", "leather"
-    ]
-    
-    # Top notes have low tenacity
-    top_note_keywords = [
-        "lemon", "bergamot", "grapefruit", "mandarin", "lime",
-        "eucalyptus", "mint", "basil"
-    ]
-    
-    # Heart notes have medium tenacity
-    heart_note_keywords = [
-        "rose", "jasmine", "ylang", "geranium", "lavender",
-        "iris", "violet"
-    ]
     
-    if any(kw in name_lower for kw in base_note_keywords):
-        return "24+ hours"
-    
-    if any(kw in name_lower for kw in top_note_keywords):
-        return "2-4 hours"
-    
-    if any(kw in name_lower for kw in heart_note_keywords):
-        return "6-12 hours"
+    for pattern, tenacity in _TENACITY_RULES:
+        if pattern.search(name_lower):
+            return tenacity
     
     return None
 
@@ -356,13 +474,20 @@ def merge_data_sources(
     if not merged.tenacity:
         merged.tenacity = infer_tenacity(name, merged.profile)
     
-    # Combine synonyms
-    synonyms = []
-    if tgsc_data:
-        synonyms.extend(tgsc_data.synonyms)
-    if pubchem_data:
-        synonyms.extend(pubchem_data.synonyms)
-    merged.synonyms = list(set(synonyms))[:50]  # Dedupe and limit
+    # Combine synonyms: case-insensitive dedupe keeping source order
+    # (TGSC first), stopping once the limit is reached
+    unique_synonyms: dict[str, str] = {}
+    for synonym in itertools.chain(
+        tgsc_data.synonyms if tgsc_data else (),
+        pubchem_data.synonyms if pubchem_data else (),
+    ):
+        stripped = synonym.strip()
+        key = stripped.lower()
+        if key and key not in unique_synonyms:
+            unique_synonyms[key] = stripped
+            if len(unique_synonyms) == 50:
+                break
+    merged.synonyms = list(unique_synonyms.values())
     
     return merged
 
@@ -371,23 +496,106 @@ def merge_data_sources(
 # Main Enrichment Function
 # =============================================================================
 
+# Names read from a batch file per bulk_enrich() call
+BATCH_FILE_CHUNK_SIZE = 500
+
+# Runs the PubChem variant search alongside the TGSC one. Tasks are leaf
+# lookups that never submit further work, so a full pool only queues.
+_source_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="enrich-source")
+
+
+def _search_tgsc_variants(
+    scraper: FragranceScraper,
+    variants: list[str],
+) -> Optional[IngredientProfile]:
+    """First TGSC hit over the search variants, in order."""
+    for variant in variants:
+        tgsc_data = scraper.search_tgsc(variant)
+        if tgsc_data:
+            return tgsc_data
+    return None
+
+
+def _search_pubchem_variants(
+    scraper: FragranceScraper,
+    variants: list[str],
+    prefetched: Optional[dict[str, Optional[PubChemData]]] = None,
+) -> Optional[PubChemData]:
+    """First PubChem hit over the search variants, using prefetched results when present."""
+    for variant in variants:
+        if prefetched is not None and variant in prefetched:
+            pubchem_data = prefetched[variant]
+        else:
+            pubchem_data = scraper.search_pubchem(variant)
+        if pubchem_data:
+            return pubchem_data
+    return None
+
+
+def _search_sources(
+    scraper: FragranceScraper,
+    variants: list[str],
+    pubchem_prefetched: Optional[dict[str, Optional[PubChemData]]] = None,
+) -> tuple[Optional[IngredientProfile], Optional[PubChemData]]:
+    """
+    Search TGSC and PubChem over the variants concurrently.
+    
+    PubChem runs in the background while TGSC runs in the calling
+    thread; the two hosts are rate limited independently, so their
+    latencies overlap.
+    """
+    pubchem_future = _source_executor.submit(
+        _search_pubchem_variants, scraper, variants, pubchem_prefetched
+    )
+    tgsc_data = _search_tgsc_variants(scraper, variants)
+    return tgsc_data, pubchem_future.result()
+
+
+def _source_key(name: str) -> str:
+    """Key under which surface forms of one ingredient share source lookups."""
+    return normalize_ingredient_name(name).lower()
+
+
+def _has_all_fields(row: Any, fields: tuple[str, ...] = ENRICHABLE_FIELDS) -> bool:
+    """Whether a row already has every one of `fields` set."""
+    values = (getattr(row, f) for f in fields)
+    return all(v is not None and v != "" for v in values)
+
+
+def _is_fully_populated(db: DatabaseAdapter, name: str, owner: str) -> bool:
+    """Whether an existing ingredient already has every enrichable field set."""
+    existing = db.get_ingredient_fields(name, ENRICHABLE_FIELDS, owner_id=owner)
+    return existing is not None and _has_all_fields(existing)
+
+
+def _fully_populated_names(db: DatabaseAdapter, names: list[str], owner: str) -> set[str]:
+    """Lowercase names of existing ingredients with every enrichable field set."""
+    rows = db.get_ingredients_fields(names, ENRICHABLE_FIELDS, owner_id=owner)
+    return {key for key, row in rows.items() if _has_all_fields(row)}
+
+
 def enrich_ingredient(
     name: str,
     owner_id: Optional[str] = None,
     fill_missing_only: bool = True,
     db: Optional[DatabaseAdapter] = None,
     scraper: Optional[FragranceScraper] = None,
+    pubchem_prefetched: Optional[dict[str, Optional[PubChemData]]] = None,
+    sources_prefetched: Optional[
+        dict[str, tuple[Optional[IngredientProfile], Optional[PubChemData]]]
+    ] = None,
+    check_populated: bool = True,
 ) -> EnrichmentResult:
     """
     Main enrichment function for a single ingredient.
     
     Process:
     1. Normalize the ingredient name
-    2. Search TGSC for fragrance-specific data
-    3. Search PubChem for chemical data
-    4. Merge data from all sources
-    5. Update the database (filling missing fields only by default)
-    6. Add synonyms
+    2. Search TGSC (fragrance-specific data) and PubChem (chemical
+       data) concurrently
+    3. Merge data from all sources
+    4. Update the database (filling missing fields only by default)
+    5. Add synonyms
     
     Args:
         name: Ingredient name to enrich
@@ -395,6 +603,12 @@ def enrich_ingredient(
         fill_missing_only: If True, only populate NULL fields
         db: Optional database adapter (uses global if not provided)
         scraper: Optional scraper (uses global if not provided)
+        pubchem_prefetched: Optional results of scraper.batch_search_pubchem();
+                            variants found in it skip the per-name PubChem lookup
+        sources_prefetched: Optional (TGSC, PubChem) results keyed by
+                            normalized lowercase name; a hit skips both searches
+        check_populated: Skip records that already have every field set
+                         (False when the caller has checked already)
     
     Returns:
         EnrichmentResult with status and updated fields
@@ -409,25 +623,25 @@ def enrich_ingredient(
     result = EnrichmentResult(ingredient_name=name, success=False)
     
     try:
+        # Nothing to fill on a complete record: skip the (slow, rate
+        # limited) source lookups entirely
+        if fill_missing_only and check_populated and _is_fully_populated(db, name, owner):
+            result.success = True
+            result.skipped = True
+            logger.info(f"Skipping '{name}': already fully populated")
+            return result
+        
         logger.info(f"Starting enrichment for: {name}")
         
         # Get search variants
         variants = get_search_variants(name)
         logger.debug(f"Search variants: {variants}")
         
-        # Search TGSC
-        tgsc_data = None
-        for variant in variants:
-            tgsc_data = scraper.search_tgsc(variant)
-            if tgsc_data:
-                break
-        
-        # Search PubChem
-        pubchem_data = None
-        for variant in variants:
-            pubchem_data = scraper.search_pubchem(variant)
-            if pubchem_data:
-                break
+        sources = sources_prefetched.get(_source_key(name)) if sources_prefetched else None
+        if sources is not None:
+            tgsc_data, pubchem_data = sources
+        else:
+            tgsc_data, pubchem_data = _search_sources(scraper, variants, pubchem_prefetched)
         
         # Check if we found any data
         if not tgsc_data and not pubchem_data:
@@ -439,27 +653,36 @@ def enrich_ingredient(
         merged = merge_data_sources(name, tgsc_data, pubchem_data)
         result.sources_used = merged.sources
         
-        # Upsert to database
+        # Upsert and add synonyms in one transaction; the scraping above
+        # happens before a connection is checked out. The record lock is
+        # held until commit so concurrent enrichments can't double-insert.
         ingredient_data = merged.to_dict()
-        ingredient, was_created = db.upsert_ingredient(
-            ingredient_data,
-            fill_missing_only=fill_missing_only,
-            owner_id=owner,
-        )
-        
-        result.was_created = was_created
-        result.updated_fields = list(ingredient_data.keys())
-        
-        # Add synonyms
-        for synonym in merged.synonyms[:20]:  # Limit synonyms
-            if synonym.lower() != name.lower():
-                db.add_synonym(
-                    ingredient_name=name,
-                    synonym=synonym,
-                    source=", ".join(merged.sources),
-                    cid=merged.cid,
-                    owner_id=owner,
-                )
+        with (
+            db.ingredient_lock(ingredient_data["name"], owner),
+            db.session() as session,
+        ):
+            ingredient, was_created = db.upsert_ingredient(
+                ingredient_data,
+                fill_missing_only=fill_missing_only,
+                owner_id=owner,
+                session=session,
+            )
+            
+            result.was_created = was_created
+            result.updated_fields = list(ingredient_data.keys())
+            
+            # Add synonyms
+            name_lower = name.lower()
+            for synonym in merged.synonyms[:20]:  # Limit synonyms
+                if synonym.lower() != name_lower:
+                    db.add_synonym(
+                        ingredient_name=name,
+                        synonym=synonym,
+                        source=", ".join(merged.sources),
+                        cid=merged.cid,
+                        owner_id=owner,
+                        session=session,
+                    )
         
         result.success = True
         logger.info(
@@ -475,10 +698,154 @@ def enrich_ingredient(
     return result
 
 
+def bulk_enrich(
+    names: list[str],
+    owner_id: Optional[str] = None,
+    fill_missing_only: bool = True,
+    concurrency: Optional[int] = None,
+    resume: bool = True,
+) -> list[EnrichmentResult]:
+    """
+    Enrich many ingredients concurrently.
+    
+    Lookups for different names overlap on a thread pool that shares the
+    scraper's HTTP session (keep-alive) and per-host rate limiter, so
+    source politeness is unchanged while network and DB waits overlap.
+    PubChem data for the names still needing enrichment is fetched up
+    front in batched requests, and names that normalize to the same
+    ingredient share one TGSC/PubChem search.
+    
+    Args:
+        names: Ingredient names to enrich
+        owner_id: Database owner ID
+        fill_missing_only: Only populate NULL fields
+        concurrency: Parallel enrichments (defaults to ENRICH_CONCURRENCY)
+        resume: Skip names an earlier run checkpointed as enriched
+    
+    Returns:
+        List of EnrichmentResult, in the same order as `names`
+    """
+    if not names:
+        return []
+    
+    logger = get_logger()
+    config = get_config()
+    workers = max(1, concurrency or config.scraper.bulk_concurrency)
+    
+    # Create the shared singletons up front rather than racing in workers
+    db = get_db()
+    scraper = get_scraper()
+    
+    owner = owner_id or config.owner_id
+    
+    # Checkpoints let a re-run of an interrupted bulk job skip records it
+    # already enriched (until the cache TTL runs out) instead of searching
+    # the sources for them again
+    use_checkpoints = fill_missing_only and config.scraper.cache_enabled
+    
+    def checkpoint_key(name: str) -> str:
+        return f"enrich:{owner}:{name.lower()}"
+    
+    done = {
+        name for name in names
+        if use_checkpoints and resume and scraper.cache.is_done(checkpoint_key(name))
+    }
+    if done:
+        logger.info(f"Skipping {len(done)} ingredients enriched by an earlier run")
+    
+    # Records with nothing left to fill, found with one chunked query
+    # rather than a probe per name (here and again in enrich_ingredient)
+    complete = _fully_populated_names(
+        db, [name for name in names if name not in done], owner
+    ) if fill_missing_only else set()
+    
+    # Batch the PubChem lookups for each name's primary search variant,
+    # skipping records that enrich_ingredient would leave alone anyway
+    pending = [
+        name for name in names
+        if name not in done and name.lower() not in complete
+    ]
+    pubchem_prefetched = {}
+    if pending:
+        try:
+            pubchem_prefetched = scraper.batch_search_pubchem(
+                [get_search_variants(name)[0] for name in pending]
+            )
+        except Exception as e:
+            # Not fatal: every name falls back to its own PubChem lookup
+            logger.warning(f"PubChem batch prefetch failed: {e}")
+    
+    # Surface forms of the same ingredient ("Bergamot", "bergamot oil",
+    # "Citrus Bergamia") normalize alike: search the sources once per
+    # normalized name, then write every record from the shared result
+    representatives: dict[str, str] = {}
+    for name in pending:
+        representatives.setdefault(_source_key(name), name)
+    
+    def search_one(name: str) -> Optional[tuple[Optional[IngredientProfile], Optional[PubChemData]]]:
+        try:
+            return _search_sources(scraper, get_search_variants(name), pubchem_prefetched)
+        except Exception as e:
+            # enrich_ingredient retries the search and reports the failure
+            logger.warning(f"Source search failed for '{name}': {e}")
+            return None
+    
+    def enrich_one(name: str) -> EnrichmentResult:
+        if name in done:
+            return EnrichmentResult(ingredient_name=name, success=True, skipped=True)
+        
+        if name.lower() in complete:
+            logger.info(f"Skipping '{name}': already fully populated")
+            return EnrichmentResult(ingredient_name=name, success=True, skipped=True)
+        
+        result = enrich_ingredient(
+            name=name,
+            owner_id=owner,
+            fill_missing_only=fill_missing_only,
+            db=db,
+            scraper=scraper,
+            sources_prefetched=sources_prefetched,
+            check_populated=False,
+        )
+        
+        # Checkpoint as soon as each record is written, so an abort loses
+        # at most the ingredients still in flight. Only once both sources
+        # answered (or nothing is left to fill): a record written from one
+        # source after the other failed must be retried by the next run.
+        if (
+            use_checkpoints
+            and result.success
+            and not result.skipped
+            and (
+                {"TGSC", "PubChem"} <= set(result.sources_used)
+                or _is_fully_populated(db, name, owner)
+            )
+        ):
+            scraper.cache.mark_done(checkpoint_key(name), {"sources": result.sources_used})
+        
+        return result
+    
+    with ThreadPoolExecutor(
+        max_workers=min(workers, len(names)),
+        thread_name_prefix="enrich",
+    ) as executor:
+        sources_prefetched = {
+            key: sources
+            for key, sources in zip(
+                representatives,
+                executor.map(search_one, representatives.values()),
+            )
+            if sources is not None
+        }
+        return list(executor.map(enrich_one, names))
+
+
 def enrich_all_ingredients(
     owner_id: Optional[str] = None,
     fill_missing_only: bool = True,
     limit: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    resume: bool = True,
 ) -> list[EnrichmentResult]:
     """
     Enrich all existing ingredients in the database.
@@ -487,6 +854,8 @@ def enrich_all_ingredients(
         owner_id: Database owner ID
         fill_missing_only: Only populate NULL fields
         limit: Maximum number of ingredients to process
+        concurrency: Parallel enrichments (defaults to ENRICH_CONCURRENCY)
+        resume: Skip names an earlier run checkpointed as enriched
     
     Returns:
         List of EnrichmentResult for each ingredient
@@ -501,22 +870,22 @@ def enrich_all_ingredients(
     ingredients = db.get_all_ingredients(owner_id=owner, limit=limit)
     logger.info(f"Found {len(ingredients)} ingredients to enrich")
     
-    results = []
-    for ingredient in ingredients:
-        result = enrich_ingredient(
-            name=ingredient.name,
-            owner_id=owner,
-            fill_missing_only=fill_missing_only,
-        )
-        results.append(result)
+    results = bulk_enrich(
+        [ingredient.name for ingredient in ingredients],
+        owner_id=owner,
+        fill_missing_only=fill_missing_only,
+        concurrency=concurrency,
+        resume=resume,
+    )
     
     # Summary
     successful = sum(1 for r in results if r.success)
     created = sum(1 for r in results if r.was_created)
+    skipped = sum(1 for r in results if r.skipped)
     
     logger.info(
         f"Enrichment complete: {successful}/{len(results)} successful, "
-        f"{created} new ingredients created"
+        f"{created} new ingredients created, {skipped} already complete"
     )
     
     return results
@@ -526,6 +895,8 @@ def batch_enrich_from_file(
     filepath: str,
     owner_id: Optional[str] = None,
     fill_missing_only: bool = True,
+    concurrency: Optional[int] = None,
+    resume: bool = True,
 ) -> list[EnrichmentResult]:
     """
     Batch enrich ingredients from a text file (one name per line).
@@ -534,6 +905,8 @@ def batch_enrich_from_file(
         filepath: Path to text file with ingredient names
         owner_id: Database owner ID
         fill_missing_only: Only populate NULL fields
+        concurrency: Parallel enrichments (defaults to ENRICH_CONCURRENCY)
+        resume: Skip names an earlier run checkpointed as enriched
     
     Returns:
         List of EnrichmentResult for each ingredient
@@ -541,22 +914,29 @@ def batch_enrich_from_file(
     logger = get_logger()
     logger.info(f"Batch enriching from {filepath}")
     
-    with open(filepath, "r", encoding="utf-8") as f:
-        # Read non-empty lines that don't start with #
-        names = [
-            line.strip() for line in f 
-            if line.strip() and not line.strip().startswith("#")
-        ]
-    
-    logger.info(f"Found {len(names)} valid ingredients to process")
-    
-    results = []
-    for name in names:
-        result = enrich_ingredient(
-            name=name,
+    # Enrich the file a chunk at a time so large files start processing
+    # immediately and only one chunk's names and prefetched PubChem data
+    # are held at once
+    results: list[EnrichmentResult] = []
+    # islice rather than itertools.batched, which needs Python 3.12
+    names = _iter_batch_file(filepath)
+    while chunk := list(itertools.islice(names, BATCH_FILE_CHUNK_SIZE)):
+        results.extend(bulk_enrich(
+            chunk,
             owner_id=owner_id,
             fill_missing_only=fill_missing_only,
-        )
-        results.append(result)
+            concurrency=concurrency,
+            resume=resume,
+        ))
+        logger.info(f"Processed {len(results)} ingredients from {filepath}")
     
     return results
+
+
+def _iter_batch_file(filepath: str) -> Iterator[str]:
+    """Yield non-empty lines that don't start with # from a batch file."""
+    with open(filepath, "r", encoding="utf-8") as f:
+        for line in f:
+            stripped = line.strip()
+            if stripped and not stripped.startswith("#"):
+                yield stripped
@@ -0,0 +1,24 @@
+"""
+Gunicorn configuration for the ParfumVault Automation API.
+
+Uses threaded (gthread) workers: request time is dominated by blocking
+scraper HTTP calls and MySQL queries, which release the GIL, so threads
+give concurrency without a second copy of the in-process caches, rate
+limiter and upsert locks that each extra worker process would carry.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('API_PORT', '5001')}"
+
+worker_class = "gthread"
+workers = int(os.getenv("GUNICORN_WORKERS", "1"))
+threads = int(os.getenv("GUNICORN_THREADS", "16"))
+
+# Scraper lookups can take tens of seconds with rate limiting and retries
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "INFO").lower()
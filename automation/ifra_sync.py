@@ -6,18 +6,25 @@ populates the IFRALibrary table in ParfumVault.
 """
 
 import csv
+import functools
+import itertools
+import logging
+import operator
+import os
 import re
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import requests
+from sqlalchemy.exc import SQLAlchemyError
 
 from config import get_config, get_logger
 from db_adapter import get_db, DatabaseAdapter
 
 
-@dataclass
+@dataclass(slots=True)
 class IFRAEntry:
     """Parsed IFRA standard entry."""
     name: str
@@ -55,36 +62,21 @@ class IFRAEntry:
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for database upsert."""
-        return {
-            "name": self.name,
-            "cas": self.cas,
-            "amendment": self.amendment,
-            "type": self.type,
-            "risk": self.risk,
-            "synonyms": self.synonyms,
-            "formula": self.formula,
-            "cat1": self.cat1,
-            "cat2": self.cat2,
-            "cat3": self.cat3,
-            "cat4": self.cat4,
-            "cat5A": self.cat5A,
-            "cat5B": self.cat5B,
-            "cat5C": self.cat5C,
-            "cat5D": self.cat5D,
-            "cat6": self.cat6,
-            "cat7A": self.cat7A,
-            "cat7B": self.cat7B,
-            "cat8": self.cat8,
-            "cat9": self.cat9,
-            "cat10A": self.cat10A,
-            "cat10B": self.cat10B,
-            "cat11A": self.cat11A,
-            "cat11B": self.cat11B,
-            "cat12": self.cat12,
-            "prohibited_notes": self.prohibited_notes,
-            "restricted_notes": self.restricted_notes,
-            "specified_notes": self.specified_notes,
-        }
+        return {name: getattr(self, name) for name in IFRA_ENTRY_FIELDS}
+
+
+# IFRAEntry field names in declaration order (the to_dict() layout)
+IFRA_ENTRY_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(IFRAEntry))
+
+# Column defaults for a parsed CSV row (no restriction in any category)
+_IFRA_ROW_DEFAULTS: dict[str, Any] = IFRAEntry(name="").to_dict()
+
+
+# File names probed in the data folder when no source is given, in priority order
+DEFAULT_SOURCE_FILENAMES = ("ifra_standards.csv", "ifra.csv", "IFRA_Library.csv")
+
+# Per-row error messages kept on a SyncResult; the rest are only counted
+MAX_SYNC_ERRORS = 100
 
 
 @dataclass
@@ -95,6 +87,7 @@ class SyncResult:
     inserted: int = 0
     updated: int = 0
     skipped: int = 0
+    skipped_duplicates: int = 0  # CSV rows merged into an earlier row
     errors: list[str] = field(default_factory=list)
 
 
@@ -144,22 +137,65 @@ class IFRACSVColumns:
     }
 
 
-def _find_column(headers: list[str], possible_names: list[str]) -> Optional[int]:
+# Category limit fields in IFRA order (cat1 ... cat12)
+IFRA_CATEGORY_FIELDS: tuple[str, ...] = tuple(IFRACSVColumns.CATEGORY_PATTERNS)
+
+# Reads all category limits off an IFRA entry as a tuple in one call
+_category_limits = operator.attrgetter(*IFRA_CATEGORY_FIELDS)
+
+
+def _header_index(headers: list[str]) -> dict[str, int]:
+    """Map normalized header names to their column index (first match wins)."""
+    index: dict[str, int] = {}
+    for i, header in enumerate(headers):
+        index.setdefault(header.lower().strip(), i)
+    return index
+
+
+def _find_column(header_index: dict[str, int], possible_names: list[str]) -> Optional[int]:
     """Find column index by trying multiple possible names."""
-    headers_lower = [h.lower().strip() for h in headers]
-    
     for name in possible_names:
-        name_lower = name.lower().strip()
-        if name_lower in headers_lower:
-            return headers_lower.index(name_lower)
+        idx = header_index.get(name.lower().strip())
+        if idx is not None:
+            return idx
     
     return None
 
 
+def _detect_delimiter(sample: str) -> str:
+    """
+    Detect the CSV delimiter from a sample of the file.
+    
+    Comment lines are ignored. Falls back to the most frequent of
+    comma, semicolon and tab when the sniffer can't decide.
+    """
+    lines = [
+        line for line in sample.splitlines()
+        if not line.lstrip().startswith(("#", "//"))
+    ]
+    data = "\n".join(lines)
+    
+    try:
+        return csv.Sniffer().sniff(data, delimiters=",;\t").delimiter
+    except csv.Error:
+        return max(",;\t", key=data.count)
+
+
+# A prohibition marker ("P", "Prohibited") or a number with an optional "%"
+_PERCENTAGE_RE = re.compile(
+    r"\s*(?:(?P<prohibited>P.*)|(?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:E[-+]?\d+)?)\s*%?)\s*",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@functools.lru_cache(maxsize=1024)
 def _parse_percentage(value: str) -> float:
     """
     Parse a percentage value from CSV.
     
+    IFRA files reuse a small set of cell values ("100", "P", "-", ...)
+    across thousands of rows, so results are memoized per raw value.
+    
     Handles formats like:
     - "0.5%" -> 0.5
     - "0.5" -> 0.5
@@ -167,92 +203,92 @@ def _parse_percentage(value: str) -> float:
     - "-" or "N/A" -> 100.0 (no restriction)
     - Empty -> 100.0
     """
-    if not value or value.strip() in ("-", "N/A", "NR", ""):
-        return 100.0
+    match = _PERCENTAGE_RE.fullmatch(value)
     
-    value = value.strip().upper()
+    if match is None:
+        # "-", "N/A", "NR", empty, or free text
+        return 0.0 if "PROHIBIT" in value.upper() else 100.0
     
-    # Prohibited
-    if value.startswith("P") or "PROHIBIT" in value:
+    if match["prohibited"] is not None:
         return 0.0
     
-    # Remove % sign and parse
-    value = value.replace("%", "").strip()
-    
-    try:
-        return float(value)
-    except ValueError:
-        return 100.0
+    return float(match["number"])
 
 
 # =============================================================================
 # CSV Parsing
 # =============================================================================
 
-def parse_ifra_csv(filepath: Path) -> list[IFRAEntry]:
+def iter_ifra_rows(filepath: Path) -> Iterator[dict[str, Any]]:
     """
-    Parse IFRA standards from a CSV file.
+    Stream IFRA standards from a CSV file as upsert-ready dicts.
     
     Supports flexible column mapping to handle different CSV formats.
+    Each dict has the same keys as IFRAEntry.to_dict(), so rows can be
+    passed to the database layer without building IFRAEntry objects.
     
     Args:
         filepath: Path to CSV file
     
-    Returns:
-        List of parsed IFRAEntry objects
+    Yields:
+        Parsed IFRA rows, in file order
     """
     logger = get_logger()
-    entries = []
+    parsed = 0
     
     with open(filepath, "r", encoding="utf-8-sig") as f:
         # Try to detect delimiter
         sample = f.read(1024)
         f.seek(0)
         
-        delimiter = ","
-        if sample.count(";") > sample.count(","):
-            delimiter = ";"
-        elif sample.count("\t") > sample.count(","):
-            delimiter = "\t"
+        reader = csv.reader(f, delimiter=_detect_delimiter(sample))
         
-        reader = csv.reader(f, delimiter=delimiter)
-        
-        # Read until we find the header row
+        # Read until we find the header row; the same reader then streams
+        # the data rows, so the file is only scanned once
         headers = None
+        header_index: dict[str, int] = {}
         for row in reader:
             if not row or (row[0] and row[0].strip().startswith(("#", "//"))):
                 continue
             
             # Check if this row looks like headers (contains Name/Ingredient)
-            if _find_column(row, IFRACSVColumns.NAME) is not None:
+            header_index = _header_index(row)
+            if _find_column(header_index, IFRACSVColumns.NAME) is not None:
                 headers = row
                 break
         
         if not headers:
             logger.error(f"No valid headers found in {filepath}")
-            return []
+            return
         
         logger.debug(f"CSV headers: {headers}")
         
         # Find column indices
-        name_idx = _find_column(headers, IFRACSVColumns.NAME)
-        cas_idx = _find_column(headers, IFRACSVColumns.CAS)
-        amendment_idx = _find_column(headers, IFRACSVColumns.AMENDMENT)
-        type_idx = _find_column(headers, IFRACSVColumns.TYPE)
-        risk_idx = _find_column(headers, IFRACSVColumns.RISK)
-        synonyms_idx = _find_column(headers, IFRACSVColumns.SYNONYMS)
-        formula_idx = _find_column(headers, IFRACSVColumns.FORMULA)
+        name_idx = _find_column(header_index, IFRACSVColumns.NAME)
+        
+        text_indices = {}
+        for field_name, possible_names in (
+            ("cas", IFRACSVColumns.CAS),
+            ("amendment", IFRACSVColumns.AMENDMENT),
+            ("type", IFRACSVColumns.TYPE),
+            ("risk", IFRACSVColumns.RISK),
+            ("synonyms", IFRACSVColumns.SYNONYMS),
+            ("formula", IFRACSVColumns.FORMULA),
+        ):
+            idx = _find_column(header_index, possible_names)
+            if idx is not None:
+                text_indices[field_name] = idx
         
         # Find category columns
         category_indices = {}
         for cat_name, possible_names in IFRACSVColumns.CATEGORY_PATTERNS.items():
-            idx = _find_column(headers, possible_names)
+            idx = _find_column(header_index, possible_names)
             if idx is not None:
                 category_indices[cat_name] = idx
         
         if name_idx is None:
             logger.error(f"Could not find Name column in {filepath}")
-            return []
+            return
         
         logger.info(f"Parsing IFRA CSV with {len(category_indices)} category columns")
         
@@ -266,42 +302,97 @@ def parse_ifra_csv(filepath: Path) -> list[IFRAEntry]:
                 if not name:
                     continue
                 
-                entry = IFRAEntry(name=name)
+                data = _IFRA_ROW_DEFAULTS.copy()
+                data["name"] = name
                 
                 # Basic fields
-                if cas_idx is not None and len(row) > cas_idx:
-                    entry.cas = row[cas_idx].strip() or None
-                
-                if amendment_idx is not None and len(row) > amendment_idx:
-                    entry.amendment = row[amendment_idx].strip() or None
-                
-                if type_idx is not None and len(row) > type_idx:
-                    entry.type = row[type_idx].strip() or None
-                
-                if risk_idx is not None and len(row) > risk_idx:
-                    entry.risk = row[risk_idx].strip() or None
-                
-                if synonyms_idx is not None and len(row) > synonyms_idx:
-                    entry.synonyms = row[synonyms_idx].strip() or None
-                
-                if formula_idx is not None and len(row) > formula_idx:
-                    entry.formula = row[formula_idx].strip() or None
+                for field_name, idx in text_indices.items():
+                    if len(row) > idx:
+                        data[field_name] = row[idx].strip() or None
                 
                 # Category values
                 for cat_name, idx in category_indices.items():
                     if len(row) > idx:
-                        value = _parse_percentage(row[idx])
-                        setattr(entry, cat_name, value)
+                        data[cat_name] = _parse_percentage(row[idx])
                 
-                entries.append(entry)
+                parsed += 1
+                yield data
                 
             except Exception as e:
                 logger.warning(f"Error parsing row {row_num}: {e}")
                 continue
         
-        logger.info(f"Parsed {len(entries)} IFRA entries from {filepath}")
+        logger.info(f"Parsed {parsed} IFRA entries from {filepath}")
+
+
+def iter_ifra_chunks(
+    filepath: Path,
+    chunksize: int = 5000
+) -> Iterator[list[dict[str, Any]]]:
+    """Stream parsed IFRA rows in lists of up to `chunksize` rows."""
+    # islice rather than itertools.batched, which needs Python 3.12
+    rows = iter_ifra_rows(filepath)
+    while chunk := list(itertools.islice(rows, chunksize)):
+        yield chunk
+
+
+def parse_ifra_rows(filepath: Path) -> list[dict[str, Any]]:
+    """
+    Parse IFRA standards from a CSV file into upsert-ready dicts.
+    
+    Args:
+        filepath: Path to CSV file
     
-    return entries
+    Returns:
+        List of parsed IFRA rows
+    """
+    return list(iter_ifra_rows(filepath))
+
+
+def dedupe_ifra_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Merge rows sharing a CAS number (or name, when there is no CAS).
+    
+    IFRA exports often repeat a material under several synonym rows.
+    The first row is kept; later duplicates only fill its missing
+    values (None, or the 100.0 "no restriction" category default),
+    mirroring a fill-missing-only upsert.
+    
+    Args:
+        rows: Parsed IFRA rows
+    
+    Returns:
+        One row per CAS/name, in first-seen order
+    """
+    merged: dict[str, dict[str, Any]] = {}
+    
+    for data in rows:
+        key = (data.get("cas") or data.get("name") or "").strip().lower()
+        first = merged.get(key)
+        
+        if first is None:
+            merged[key] = data
+            continue
+        
+        for field_name, value in data.items():
+            current = first.get(field_name)
+            if value is not None and (current is None or current == 100.0):
+                first[field_name] = value
+    
+    return list(merged.values())
+
+
+def parse_ifra_csv(filepath: Path) -> list[IFRAEntry]:
+    """
+    Parse IFRA standards from a CSV file.
+    
+    Args:
+        filepath: Path to CSV file
+    
+    Returns:
+        List of parsed IFRAEntry objects
+    """
+    return [IFRAEntry(**data) for data in parse_ifra_rows(filepath)]
 
 
 # =============================================================================
@@ -361,6 +452,35 @@ def download_ifra_standards(
 # Main Sync Function
 # =============================================================================
 
+def _resolve_default_source(data_dir: str) -> Optional[str]:
+    """
+    Find the first default IFRA CSV present in the data folder.
+    
+    Reads the directory once instead of stat-ing every candidate name.
+    Not cached: the file may be added while the API server is running.
+    
+    Args:
+        data_dir: Folder to look in
+        
+    Returns:
+        Path of the first matching file, or None
+    """
+    try:
+        with os.scandir(data_dir) as it:
+            present = {
+                entry.name for entry in it
+                if entry.name in DEFAULT_SOURCE_FILENAMES and entry.is_file()
+            }
+    except OSError:
+        return None
+    
+    for filename in DEFAULT_SOURCE_FILENAMES:
+        if filename in present:
+            return os.path.join(data_dir, filename)
+    
+    return None
+
+
 def sync_ifra_library(
     source: Optional[str] = None,
     owner_id: Optional[str] = None,
@@ -373,7 +493,7 @@ def sync_ifra_library(
     Process:
     1. Load IFRA entries from CSV file (or download if URL provided)
     2. For each entry, match by CAS number or name
-    3. Insert new or update existing entries
+    3. Insert new or update existing entries in a single transaction
     4. Respect user customizations if fill_missing_only=True
     
     Args:
@@ -396,12 +516,7 @@ def sync_ifra_library(
         # Determine source
         if source is None:
             # Try default locations
-            data_dir = Path(config.data_dir)
-            for filename in ["ifra_standards.csv", "ifra.csv", "IFRA_Library.csv"]:
-                potential_path = data_dir / filename
-                if potential_path.exists():
-                    source = str(potential_path)
-                    break
+            source = _resolve_default_source(config.data_dir)
         
         if source is None:
             result.errors.append(
@@ -428,40 +543,56 @@ def sync_ifra_library(
             logger.error(result.errors[0])
             return result
         
-        entries = parse_ifra_csv(source_path)
-        result.total_entries = len(entries)
+        logger.info(f"Syncing IFRA entries from {source_path} to database")
         
-        if not entries:
+        # Parse and upsert chunk by chunk inside one transaction, so the
+        # file is never fully in memory and DB work starts with the first
+        # chunk. If it fails, redo the rows one at a time so a bad row is
+        # reported instead of failing the sync.
+        try:
+            with db.session() as session:
+                # A first sync into an empty library is all INSERTs, so the
+                # first chunk can skip the existing-row lookups. Later chunks
+                # still need them to match rows from earlier chunks.
+                library_empty = db.count_ifra_entries(owner_id=owner, session=session) == 0
+                
+                for chunk in iter_ifra_chunks(source_path):
+                    optimize = "new" if library_empty and not result.total_entries else "auto"
+                    result.total_entries += len(chunk)
+                    unique = dedupe_ifra_rows(chunk)
+                    result.skipped_duplicates += len(chunk) - len(unique)
+                    inserted, updated = db.bulk_upsert_ifra_entries(
+                        unique,
+                        fill_missing_only=fill_missing_only,
+                        owner_id=owner,
+                        optimize=optimize,
+                        session=session,
+                    )
+                    result.inserted += inserted
+                    result.updated += updated
+            result.skipped = (
+                result.total_entries - result.inserted - result.updated
+                - result.skipped_duplicates
+            )
+        except SQLAlchemyError as e:
+            logger.warning(f"Bulk IFRA upsert failed ({e}), retrying row by row")
+            rows = parse_ifra_rows(source_path)
+            entries = dedupe_ifra_rows(rows)
+            result.total_entries = len(rows)
+            result.skipped_duplicates = len(rows) - len(entries)
+            result.inserted = result.updated = result.skipped = 0
+            _sync_rows_individually(db, entries, fill_missing_only, owner, result)
+        
+        if not result.total_entries:
             result.errors.append("No entries parsed from CSV file")
             logger.warning(result.errors[0])
             return result
         
-        logger.info(f"Syncing {len(entries)} IFRA entries to database")
-        
-        # Process each entry
-        for entry in entries:
-            try:
-                ifra_data = entry.to_dict()
-                _, was_created = db.upsert_ifra_entry(
-                    ifra_data,
-                    fill_missing_only=fill_missing_only,
-                    owner_id=owner,
-                )
-                
-                if was_created:
-                    result.inserted += 1
-                else:
-                    result.updated += 1
-                    
-            except Exception as e:
-                result.skipped += 1
-                result.errors.append(f"Error processing '{entry.name}': {e}")
-                logger.warning(f"Skipped '{entry.name}': {e}")
-        
         result.success = True
         logger.info(
             f"IFRA sync complete: {result.inserted} inserted, "
-            f"{result.updated} updated, {result.skipped} skipped"
+            f"{result.updated} updated, {result.skipped} skipped, "
+            f"{result.skipped_duplicates} duplicates merged"
         )
         
     except Exception as e:
@@ -471,9 +602,68 @@ def sync_ifra_library(
     return result
 
 
+def _sync_rows_individually(
+    db: DatabaseAdapter,
+    entries: list[dict[str, Any]],
+    fill_missing_only: bool,
+    owner: str,
+    result: SyncResult,
+) -> None:
+    """
+    Upsert IFRA rows one transaction each, recording per-row failures.
+    
+    Rows are spread over a thread pool sized to the DB connection pool so
+    the round trips overlap; upsert_ifra_entry serializes rows sharing a
+    CAS or a name through the adapter's record locks.
+    """
+    logger = get_logger()
+    workers = max(1, min(get_config().db.pool_size, 8))
+    
+    def upsert_one(ifra_data: dict[str, Any]) -> tuple[Optional[bool], Optional[Exception]]:
+        try:
+            _, was_created = db.upsert_ifra_entry(
+                ifra_data,
+                fill_missing_only=fill_missing_only,
+                owner_id=owner,
+            )
+            return was_created, None
+        except Exception as e:
+            return None, e
+    
+    # Messages are only formatted for the failures that get reported
+    failures: list[tuple[str, Exception]] = []
+    
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ifra-sync") as executor:
+        for ifra_data, (was_created, error) in zip(entries, executor.map(upsert_one, entries)):
+            if error is not None:
+                failures.append((ifra_data["name"], error))
+            elif was_created:
+                result.inserted += 1
+            else:
+                result.updated += 1
+    
+    if not failures:
+        return
+    
+    result.skipped += len(failures)
+    for name, error in failures[:MAX_SYNC_ERRORS]:
+        result.errors.append(f"Error processing '{name}': {error}")
+    if len(failures) > MAX_SYNC_ERRORS:
+        result.errors.append(f"... {len(failures) - MAX_SYNC_ERRORS} more rows skipped")
+    
+    logger.warning(
+        "Skipped %d IFRA rows (first: '%s': %s)",
+        len(failures), failures[0][0], failures[0][1],
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        for name, error in failures:
+            logger.debug("Skipped '%s': %s", name, error)
+
+
 def update_ingredients_from_ifra(
     owner_id: Optional[str] = None,
     db: Optional[DatabaseAdapter] = None,
+    use_sql_bulk: bool = True,
 ) -> dict[str, int]:
     """
     Update ingredient IFRA limits from the IFRALibrary table.
@@ -484,6 +674,9 @@ def update_ingredients_from_ifra(
     Args:
         owner_id: Database owner ID
         db: Optional database adapter
+        use_sql_bulk: Do the whole update as one server-side
+                      UPDATE ... JOIN (MySQL); if False, match and
+                      update the ingredients from Python
     
     Returns:
         Dictionary with counts: matched, updated, skipped
@@ -494,51 +687,58 @@ def update_ingredients_from_ifra(
     db = db or get_db()
     owner = owner_id or config.owner_id
     
+    if use_sql_bulk:
+        try:
+            return db.update_ingredient_ifra_limits(owner_id=owner)
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to update ingredient IFRA limits: {e}")
+            return {"matched": 0, "updated": 0, "skipped": 0}
+    
     counts = {"matched": 0, "updated": 0, "skipped": 0}
     
-    # Get all ingredients with CAS numbers
-    ingredients = db.get_all_ingredients(owner_id=owner)
+    # Get (id, name, cas) of the ingredients that have a CAS number
+    ingredients = db.get_ingredient_cas_pairs(owner_id=owner, require_cas=True)
     
-    for ingredient in ingredients:
-        if not ingredient.cas:
-            counts["skipped"] += 1
-            continue
-        
-        # Find matching IFRA entry
-        ifra_entry = db.get_ifra_entry_by_cas(ingredient.cas, owner_id=owner)
-        
-        if not ifra_entry:
-            counts["skipped"] += 1
-            continue
-        
-        counts["matched"] += 1
-        
-        # Build update data with IFRA limits
-        update_data = {
-            "name": ingredient.name,
-        }
-        
-        # Copy category limits
-        category_fields = [
-            "cat1", "cat2", "cat3", "cat4", "cat5A", "cat5B", "cat5C", "cat5D",
-            "cat6", "cat7A", "cat7B", "cat8", "cat9", "cat10A", "cat10B",
-            "cat11A", "cat11B", "cat12"
-        ]
-        
-        for field in category_fields:
-            ifra_value = getattr(ifra_entry, field, 100.0)
-            update_data[field] = ifra_value
-        
-        # Update ingredient
-        try:
-            db.upsert_ingredient(
-                update_data,
+    try:
+        with db.session() as session:
+            # One lookup for every CAS instead of a query per ingredient
+            ifra_by_cas = db.get_ifra_entries_by_cas(
+                (ingredient.cas for ingredient in ingredients),
+                owner_id=owner,
+                session=session,
+            )
+            
+            updates = []
+            for ingredient in ingredients:
+                # Find matching IFRA entry
+                ifra_entry = ifra_by_cas.get(ingredient.cas.strip().lower())
+                
+                if not ifra_entry:
+                    continue
+                
+                counts["matched"] += 1
+                
+                # Build update data with IFRA limits
+                update_data = dict(zip(IFRA_CATEGORY_FIELDS, _category_limits(ifra_entry)))
+                update_data["name"] = ingredient.name
+                
+                updates.append(update_data)
+            
+            # Update all matched ingredients in the same transaction
+            counts["updated"] = db.bulk_update_ingredients(
+                updates,
                 fill_missing_only=True,
                 owner_id=owner,
+                session=session,
             )
-            counts["updated"] += 1
-        except Exception as e:
-            logger.warning(f"Failed to update '{ingredient.name}': {e}")
+            
+            # Everything without a CAS or a library match was skipped
+            total = db.get_ingredient_stats(owner_id=owner, session=session)["total"]
+            counts["skipped"] = total - counts["matched"]
+    
+    except SQLAlchemyError as e:
+        counts["updated"] = 0
+        logger.error(f"Failed to update ingredient IFRA limits: {e}")
     
     logger.info(
         f"IFRA limits update: {counts['matched']} matched, "
@@ -33,6 +33,7 @@ import click
 from config import get_config, get_logger, setup_logging
 from db_adapter import get_db
 from enrichment import (
+    bulk_enrich,
     enrich_ingredient,
     enrich_all_ingredients,
     batch_enrich_from_file,
@@ -82,12 +83,24 @@ from ifra_sync import sync_ifra_library, update_ingredients_from_ifra, SyncResul
     default=None,
     help="Owner ID for database records (default: from config)"
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Ingredients to enrich in parallel (for --target batch/all, default: ENRICH_CONCURRENCY)"
+)
 @click.option(
     "--overwrite",
     is_flag=True,
     default=False,
     help="Overwrite existing data (default: only fill missing)"
 )
+@click.option(
+    "--no-resume",
+    is_flag=True,
+    default=False,
+    help="Redo ingredients an interrupted earlier run already enriched (for --target batch/all)"
+)
 @click.option(
     "--test-db",
     is_flag=True,
@@ -109,7 +122,9 @@ def main(
     batch_file: str,
     limit: int,
     owner_id: str,
+    concurrency: int,
     overwrite: bool,
+    no_resume: bool,
     test_db: bool,
     verbose: bool,
 ):
@@ -151,10 +166,10 @@ def main(
         if not batch_file:
             logger.error("--file is required for --target batch")
             sys.exit(1)
-        _batch_enrich(batch_file, owner_id, fill_missing_only)
+        _batch_enrich(batch_file, owner_id, fill_missing_only, concurrency, not no_resume)
     
     elif target == "all":
-        _enrich_all(owner_id, fill_missing_only, limit)
+        _enrich_all(owner_id, fill_missing_only, limit, concurrency, not no_resume)
     
     elif target == "update-ifra-limits":
         _update_ifra_limits(owner_id)
@@ -240,6 +255,8 @@ def _batch_enrich(
     filepath: str,
     owner_id: str | None,
     fill_missing_only: bool,
+    concurrency: int | None,
+    resume: bool = True,
 ):
     """Batch enrich from a file."""
     logger = get_logger()
@@ -250,6 +267,8 @@ def _batch_enrich(
         filepath=filepath,
         owner_id=owner_id,
         fill_missing_only=fill_missing_only,
+        concurrency=concurrency,
+        resume=resume,
     )
     
     _print_batch_results(results)
@@ -259,6 +278,8 @@ def _enrich_all(
     owner_id: str | None,
     fill_missing_only: bool,
     limit: int | None,
+    concurrency: int | None,
+    resume: bool = True,
 ):
     """Enrich all ingredients in database."""
     logger = get_logger()
@@ -272,6 +293,8 @@ def _enrich_all(
         owner_id=owner_id,
         fill_missing_only=fill_missing_only,
         limit=limit,
+        concurrency=concurrency,
+        resume=resume,
     )
     
     _print_batch_results(results)
@@ -301,7 +324,10 @@ def _print_enrichment_result(result: EnrichmentResult):
     click.echo()
     
     if result.success:
-        status = "Created" if result.was_created else "Updated"
+        if result.skipped:
+            status = "Already complete"
+        else:
+            status = "Created" if result.was_created else "Updated"
         click.secho(f"✓ {status}: {result.ingredient_name}", fg="green")
         
         if result.updated_fields:
@@ -329,14 +355,18 @@ def _print_sync_result(result: SyncResult):
     click.echo(f"  Updated: {result.updated}")
     click.echo(f"  Skipped: {result.skipped}")
     
+    if result.skipped_duplicates:
+        click.echo(f"  Duplicates merged: {result.skipped_duplicates}")
+    
     if result.errors:
         click.echo()
         click.secho("Errors:", fg="yellow")
-        for error in result.errors[:10]:  # Limit displayed errors
-            click.echo(f"  - {error}")
+        lines = [f"  - {error}" for error in result.errors[:10]]  # Limit displayed errors
         
         if len(result.errors) > 10:
-            click.echo(f"  ... and {len(result.errors) - 10} more errors")
+            lines.append(f"  ... and {len(result.errors) - 10} more errors")
+        
+        click.echo("\n".join(lines))
 
 
 def _print_batch_results(results: list[EnrichmentResult]):
@@ -345,22 +375,25 @@ def _print_batch_results(results: list[EnrichmentResult]):
     
     successful = sum(1 for r in results if r.success)
     created = sum(1 for r in results if r.was_created)
+    skipped = sum(1 for r in results if r.skipped)
     failed = len(results) - successful
     
     click.secho("Batch Enrichment Complete:", fg="blue", bold=True)
     click.echo(f"  Total: {len(results)}")
     click.secho(f"  Successful: {successful}", fg="green")
     click.echo(f"  Created: {created}")
+    click.echo(f"  Already complete: {skipped}")
     
     if failed > 0:
         click.secho(f"  Failed: {failed}", fg="red")
         
-        # Show failed items
+        # Show failed items in a single write
         click.echo()
         click.echo("Failed items:")
-        for r in results:
-            if not r.success:
-                click.echo(f"  - {r.ingredient_name}: {r.error_message}")
+        click.echo("\n".join(
+            f"  - {r.ingredient_name}: {r.error_message}"
+            for r in results if not r.success
+        ))
 
 
 # =============================================================================
@@ -380,8 +413,7 @@ def quick(names: tuple[str, ...], owner_id: str | None):
         click.echo("Please provide ingredient names")
         return
     
-    for name in names:
-        result = enrich_ingredient(name=name, owner_id=owner_id)
+    for result in bulk_enrich(list(names), owner_id=owner_id):
         _print_enrichment_result(result)
 
 
@@ -412,15 +444,16 @@ def status(owner_id: str | None):
     click.echo()
     
     # Ingredient stats
-    ingredients = db.get_all_ingredients(owner_id=owner)
+    stats = db.get_ingredient_stats(owner_id=owner)
+    total = stats["total"]
     click.echo("Ingredient Statistics:")
-    click.echo(f"  Total: {len(ingredients)}")
+    click.echo(f"  Total: {total}")
     
-    with_cas = sum(1 for i in ingredients if i.cas)
-    with_profile = sum(1 for i in ingredients if i.profile)
+    with_cas = stats["with_cas"]
+    with_profile = stats["with_profile"]
     
-    click.echo(f"  With CAS: {with_cas} ({100*with_cas//max(len(ingredients),1)}%)")
-    click.echo(f"  With Profile: {with_profile} ({100*with_profile//max(len(ingredients),1)}%)")
+    click.echo(f"  With CAS: {with_cas} ({100*with_cas//max(total,1)}%)")
+    click.echo(f"  With Profile: {with_profile} ({100*with_profile//max(total,1)}%)")
     
     click.echo()
     
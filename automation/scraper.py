@@ -9,34 +9,142 @@ Features:
 - Robust error handling with retries
 """
 
-import hashlib
+import functools
+import itertools
 import json
+import random
 import re
+import threading
 import time
+import traceback
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any, Optional
-from urllib.parse import quote_plus, urljoin
+from urllib.parse import quote_plus, urljoin, urlsplit
 
+import diskcache
+from diskcache.core import UNKNOWN
+import lxml.html
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
 from fake_useragent import UserAgent
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_exponential_jitter,
     retry_if_exception_type,
 )
 
+# Search-engine fallbacks for finding TGSC pages; optional at runtime
+try:
+    from duckduckgo_search import DDGS
+except ImportError:
+    DDGS = None
+try:
+    from googlesearch import search as google_search
+except ImportError:
+    google_search = None
+
+from cache import MemoryCache
 from config import get_config, get_logger
 
 
+def _json_body(response: Any) -> Any:
+    """Decode a JSON response body with orjson (faster than Response.json())."""
+    if isinstance(response, _CachedResponse):
+        return orjson.loads(response.text)  # Already decoded; skip re-encoding
+    return orjson.loads(response.content)
+
+
+
+def _scan_for_tgsc_link(response: requests.Response) -> tuple[Optional[str], bytes]:
+    """
+    Read a streamed TGSC search response up to its first data/rw link.
+    
+    On a hit the connection is closed without downloading the rest of
+    the page.
+    
+    Returns:
+        (link or None, body bytes read so far - the whole body on a miss)
+    """
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=16384):
+        # Re-scan a little of the previous chunk for links split across two
+        start = max(0, len(body) - 64)
+        body += chunk
+        match = _TGSC_LINK_RE.search(body, start)
+        if match:
+            response.close()
+            return match.group(0).decode("ascii"), bytes(body)
+    
+    return None, bytes(body)
+
+
+# PubChem reports its load on every response, e.g. "Request Count status:
+# Green (0%), Request Time status: Yellow (60%), Service status: Green (10%)"
+_THROTTLE_STATUS_RE = re.compile(r"status:\s*(\w+)")
+_THROTTLE_LEVELS = {"Green": 0, "Yellow": 1, "Red": 2, "Black": 3}
+
+
+def _throttle_level(response: requests.Response) -> int:
+    """Worst level in an X-Throttling-Control header (0 = Green or absent)."""
+    header = response.headers.get("X-Throttling-Control", "")
+    return max(
+        (_THROTTLE_LEVELS.get(status, 0) for status in _THROTTLE_STATUS_RE.findall(header)),
+        default=0,
+    )
+
+
+def _retry_after_seconds(response: requests.Response, default: float) -> float:
+    """Seconds a Retry-After header asks us to wait (delay or HTTP-date form)."""
+    header = response.headers.get("Retry-After")
+    if header is None:
+        return default
+    
+    try:
+        return max(float(header), 0.0)
+    except ValueError:
+        pass
+    
+    try:
+        return max(parsedate_to_datetime(header).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return default
+
+
+def _quota_reset_seconds(response: requests.Response) -> Optional[float]:
+    """
+    Seconds until the host's request quota refills, when it is spent.
+    
+    Read from X-RateLimit-Remaining/X-RateLimit-Reset; None while requests
+    remain or the headers are absent. Reset may be a delay or a Unix time.
+    """
+    try:
+        remaining = int(response.headers["X-RateLimit-Remaining"])
+        reset = float(response.headers["X-RateLimit-Reset"])
+    except (KeyError, ValueError):
+        return None
+    
+    if remaining > 1:
+        return None
+    
+    if reset > 1e9:  # Unix timestamp rather than a delay
+        reset -= time.time()
+    
+    return max(reset, 0.0)
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class IngredientProfile:
     """Scraped ingredient data from TGSC or similar sources."""
     name: str
@@ -49,7 +157,6 @@ class IngredientProfile:
     specific_gravity: Optional[str] = None
     boiling_point: Optional[str] = None
     molecular_formula: Optional[str] = None
-    molecular_formula: Optional[str] = None
     molecular_weight: Optional[str] = None
     # New fields
     tenacity: Optional[str] = None
@@ -58,13 +165,14 @@ class IngredientProfile:
     shelf_life: Optional[str] = None
     einecs: Optional[str] = None
     reach: Optional[str] = None
+    fema: Optional[str] = None  # e.g. "FEMA 2635", also listed in `uses`
     
     synonyms: list[str] = field(default_factory=list)
     uses: list[str] = field(default_factory=list)
     source: str = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class PubChemData:
     """Chemical data from PubChem API."""
     cid: int
@@ -76,7 +184,7 @@ class PubChemData:
     synonyms: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class IFRAData:
     """IFRA restriction data for an ingredient."""
     name: str
@@ -136,6 +244,35 @@ class TGSCSelectors:
     }
 
 
+# Page-parsing regexes, compiled once. A table label belongs to a field if it
+# contains any of that field's LABEL_PATTERNS.
+_CAS_RE = re.compile(TGSCSelectors.CAS_PATTERN)
+_LABEL_RES = {
+    field_name: re.compile("|".join(map(re.escape, labels)))
+    for field_name, labels in TGSCSelectors.LABEL_PATTERNS.items()
+}
+_ODOR_TEXT_RE = re.compile(r'odor[:\s]+([a-zA-Z\s,]+?)(?:flavor|$|\n|\r|<)', re.IGNORECASE)
+_FLAVOR_TEXT_RE = re.compile(r'flavor[:\s]+([a-zA-Z\s,]+?)(?:odor|$|\n|\r|<)', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_CAS_SYNONYM_RE = re.compile(rf"^{TGSCSelectors.CAS_PATTERN}", re.MULTILINE)
+_TGSC_LINK_RE = re.compile(rb'data/rw\d+\.html')
+_TGSC_HREF_RE = re.compile(r'data/rw')
+
+
+def _cell_text(cell: lxml.html.HtmlElement) -> str:
+    """Text of a table cell, each fragment stripped (as bs4's get_text(strip=True))."""
+    return "".join(text.strip() for text in cell.itertext())
+
+
+@functools.lru_cache(maxsize=1024)
+def _label_fields(label: str) -> frozenset[str]:
+    """Fields whose LABEL_PATTERNS occur in a lowercased table label."""
+    return frozenset(
+        field_name for field_name, pattern in _LABEL_RES.items()
+        if pattern.search(label)
+    )
+
+
 class CommonChemistryAPI:
     """
     Common Chemistry from CAS (Chemical Abstracts Service).
@@ -197,75 +334,173 @@ class PubChemAPI:
         encoded = quote_plus(name)
         return f"{PubChemAPI.BASE_URL}/compound/name/{encoded}/JSON"
     
+    # Properties fetched for every compound
+    PROPERTIES = ["MolecularFormula", "MolecularWeight", "IUPACName"]
+    
+    # CIDs per property/synonym request (keeps URLs well under limits)
+    MAX_CIDS_PER_REQUEST = 100
+    
+    # PubChem requires specific User-Agent with contact info
+    HEADERS = {
+        "User-Agent": "ParfumVault/1.0 (admin@parfumvault.local)"
+    }
+    
+    @staticmethod
+    def get_cids(name: str) -> str:
+        """Get the name -> CID lookup URL (lighter than the full record)."""
+        encoded = quote_plus(name)
+        return f"{PubChemAPI.BASE_URL}/compound/name/{encoded}/cids/JSON"
+    
+    @staticmethod
+    def _cid_list(cid: int | list[int]) -> str:
+        """Format one CID or a list of CIDs for a URL path."""
+        if isinstance(cid, int):
+            return str(cid)
+        return ",".join(str(c) for c in cid)
+    
     @staticmethod
-    def get_synonyms(cid: int) -> str:
-        """Get synonyms URL for a compound."""
-        return f"{PubChemAPI.BASE_URL}/compound/cid/{cid}/synonyms/JSON"
+    def get_synonyms(cid: int | list[int]) -> str:
+        """Get synonyms URL for one or more compounds."""
+        return f"{PubChemAPI.BASE_URL}/compound/cid/{PubChemAPI._cid_list(cid)}/synonyms/JSON"
     
     @staticmethod
-    def get_properties(cid: int, properties: list[str]) -> str:
-        """Get specific properties URL."""
+    def get_properties(cid: int | list[int], properties: list[str]) -> str:
+        """Get specific properties URL for one or more compounds."""
         props = ",".join(properties)
-        return f"{PubChemAPI.BASE_URL}/compound/cid/{cid}/property/{props}/JSON"
+        return (
+            f"{PubChemAPI.BASE_URL}/compound/cid/{PubChemAPI._cid_list(cid)}"
+            f"/property/{props}/JSON"
+        )
 
 
 # =============================================================================
 # Cache Implementation
 # =============================================================================
 
+class _OrjsonDisk(diskcache.JSONDisk):
+    """diskcache serializer storing values as zlib-compressed orjson."""
+    
+    def store(self, value, read, key=UNKNOWN):
+        if not read:
+            value = zlib.compress(orjson.dumps(value), self.compress_level)
+        return super(diskcache.JSONDisk, self).store(value, read, key=key)
+    
+    def fetch(self, mode, filename, value, read):
+        data = super(diskcache.JSONDisk, self).fetch(mode, filename, value, read)
+        if not read:
+            data = orjson.loads(zlib.decompress(data))
+        return data
+
+
+class _CachedResponse:
+    """The parts of requests.Response that callers use, replayed from the cache."""
+    
+    __slots__ = ("text", "status_code", "encoding", "_content")
+    
+    def __init__(self, data: dict):
+        self.text = data.get("text", "")
+        self.status_code = data.get("status_code", 200)
+        self.encoding = data.get("encoding") or "utf-8"
+        self._content: Optional[bytes] = None
+    
+    @property
+    def content(self) -> bytes:
+        """Body bytes, encoded on first use with the charset it was decoded with."""
+        if self._content is None:
+            self._content = self.text.encode(self.encoding, "replace")
+        return self._content
+    
+    def json(self) -> Any:
+        return orjson.loads(self.text)
+    
+    def raise_for_status(self) -> None:
+        pass
+
+
 class ResponseCache:
     """
-    Simple file-based cache for HTTP responses.
+    Disk cache for HTTP responses, backed by diskcache (SQLite).
     
-    Reduces redundant requests to external services.
+    Reduces redundant requests to external services. Safe to share
+    between threads and between the API server's worker processes.
     """
     
+    # Least recently stored entries are culled beyond this many bytes
+    SIZE_LIMIT = 512 * 1024 * 1024
+    
+    # Hot responses kept in process memory in front of the disk cache
+    MEMORY_ENTRIES = 2048
+    
     def __init__(self, cache_dir: Path, ttl_hours: int = 24):
         self.cache_dir = cache_dir
-        self.ttl = timedelta(hours=ttl_hours)
+        self.ttl_seconds = ttl_hours * 3600.0
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._cache = diskcache.Cache(
+            str(cache_dir),
+            size_limit=self.SIZE_LIMIT,
+            disk=_OrjsonDisk,
+            disk_compress_level=6,
+        )
+        self._memory = MemoryCache(
+            max_entries=self.MEMORY_ENTRIES,
+            ttl_seconds=self.ttl_seconds,
+        )
+        self._migrate_json_files()
     
-    def _get_cache_key(self, url: str) -> str:
-        """Generate cache key from URL."""
-        return hashlib.md5(url.encode()).hexdigest()
-    
-    def _get_cache_path(self, url: str) -> Path:
-        """Get cache file path for URL."""
-        key = self._get_cache_key(url)
-        return self.cache_dir / f"{key}.json"
+    def _migrate_json_files(self) -> None:
+        """Move still-valid entries of the old one-JSON-file-per-URL cache in."""
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                
+                cached_at = datetime.fromisoformat(data["cached_at"]).timestamp()
+                remaining = self.ttl_seconds - (time.time() - cached_at)
+                if remaining > 0:
+                    self._cache.set(data["url"], data["response"], expire=remaining)
+            except (OSError, json.JSONDecodeError, KeyError, ValueError):
+                pass
+            
+            path.unlink(missing_ok=True)
     
     def get(self, url: str) -> Optional[dict]:
-        """Get cached response if valid."""
-        cache_path = self._get_cache_path(url)
+        """Get cached response if valid, from memory before disk."""
+        response = self._memory.get(url)
+        if response is not None:
+            return response
         
-        if not cache_path.exists():
-            return None
+        response, expire_time = self._cache.get(url, expire_time=True)
+        if response is not None:
+            # Keep the disk entry's expiry so memory never outlives it
+            self._memory.set(url, response, ttl_seconds=expire_time - time.time())
         
-        try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            cached_time = datetime.fromisoformat(data["cached_at"])
-            if datetime.now() - cached_time > self.ttl:
-                cache_path.unlink()  # Expired
-                return None
-            
-            return data["response"]
-        except (json.JSONDecodeError, KeyError, ValueError):
-            return None
+        return response
     
-    def set(self, url: str, response: dict) -> None:
-        """Cache a response."""
-        cache_path = self._get_cache_path(url)
-        
-        data = {
-            "url": url,
-            "cached_at": datetime.now().isoformat(),
-            "response": response,
-        }
-        
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def set(self, url: str, response: dict, ttl_seconds: Optional[float] = None) -> None:
+        """Cache a response (for `ttl_seconds`, default the cache TTL)."""
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        self._cache.set(url, response, expire=ttl)
+        self._memory.set(url, response, ttl_seconds=ttl)
+    
+    def delete(self, url: str) -> None:
+        """Drop a cached response from memory and disk."""
+        self._memory.delete(url)
+        self._cache.delete(url)
+    
+    # -------------------------------------------------------------------------
+    # Checkpoints
+    # -------------------------------------------------------------------------
+    
+    # Checkpoints share the disk cache under their own key prefix
+    CHECKPOINT_PREFIX = "__done__:"
+    
+    def mark_done(self, key: str, payload: Optional[dict] = None) -> None:
+        """Record that the work identified by `key` finished (expires with the TTL)."""
+        self._cache.set(self.CHECKPOINT_PREFIX + key, payload or {}, expire=self.ttl_seconds)
+    
+    def is_done(self, key: str) -> bool:
+        """Check for an unexpired checkpoint recorded by mark_done()."""
+        return self.CHECKPOINT_PREFIX + key in self._cache
 
 
 # =============================================================================
@@ -283,13 +518,63 @@ class FragranceScraper:
     - Retry with exponential backoff
     """
     
-    # Common User-Agents as fallback
+    # Common User-Agents as fallback (complete browser strings; truncated
+    # ones are an easy bot signature)
     FALLBACK_USER_AGENTS = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 "
+        "(KHTML, like Gecko) Version/17.4 Safari/605.1.15",
+        "Mozilla/5.0 (X11; Linux x86_64; rv:125.0) Gecko/20100101 Firefox/125.0",
     ]
     
+    # User-Agents sampled from fake-useragent at start-up and rotated
+    UA_POOL_SIZE = 64
+    
+    # Keep-alive connection pools: hosts cached, connections kept per host.
+    # Sized for the API's worker threads plus bulk enrichment fan-out, which
+    # would otherwise exceed urllib3's default of 10 and reconnect per request.
+    HTTP_POOL_HOSTS = 8
+    HTTP_POOL_SIZE = 32
+    
+    # Hosts with a documented request budget of their own; every other host
+    # is spaced by SCRAPER_DELAY. PubChem allows 5 requests per second.
+    HOST_DELAY_SECONDS = {
+        "pubchem.ncbi.nlm.nih.gov": 0.2,
+    }
+    
+    # Requests allowed in flight at once per host; spacing alone doesn't
+    # bound this when responses are slow. Other hosts use
+    # SCRAPER_HOST_CONCURRENCY.
+    HOST_CONCURRENCY = {
+        "www.thegoodscentscompany.com": 2,
+        "pubchem.ncbi.nlm.nih.gov": 5,
+        "commonchemistry.cas.org": 3,
+    }
+    
+    # Random extra spacing, as a fraction of the host's delay, so requests
+    # don't arrive on a fixed beat and concurrent workers don't fire in lockstep
+    RATE_JITTER_FRACTION = 0.25
+    
+    # Adaptive spacing: a host's delay doubles on 429/503 (up to the cap) and
+    # halves back toward its base delay after a run of successful requests
+    MAX_HOST_DELAY_SECONDS = 30.0
+    BACKOFF_RECOVERY_SUCCESSES = 50
+    
+    # Retries of a request answered with 429/503 before giving up on it
+    THROTTLE_RETRIES = 3
+    
+    # Concurrent PubChem name -> CID lookups in batch_search_pubchem()
+    PUBCHEM_CID_WORKERS = 4
+    
+    # How long a name TGSC has no page for is remembered (capped by the
+    # cache TTL); shorter than a hit, since TGSC adds pages over time
+    TGSC_MISS_TTL_SECONDS = 6 * 3600
+    
+    # BeautifulSoup tree builder; lxml's C parser is several times faster
+    # than the pure-Python "html.parser" on large TGSC pages
+    HTML_PARSER = "lxml"
+    
     def __init__(self):
         self.config = get_config()
         self.logger = get_logger()
@@ -301,51 +586,161 @@ class FragranceScraper:
             ttl_hours=self.config.scraper.cache_ttl_hours
         )
         
-        # Initialize User-Agent rotator
+        # Initialize User-Agent rotator: sample a pool once, then cycle it
+        # (next() on a cycle is atomic, so worker threads can share it)
         try:
-            self.ua = UserAgent()
+            ua = UserAgent()
+            agents = list(dict.fromkeys(ua.random for _ in range(self.UA_POOL_SIZE)))
         except Exception:
-            self.ua = None
+            agents = self.FALLBACK_USER_AGENTS
             self.logger.warning("fake-useragent failed, using fallback agents")
         
-        self._ua_index = 0
-        self._last_request_time = 0.0
+        self._agents = itertools.cycle(agents)
+        
+        # Per-host request schedule; hosts are throttled independently so a
+        # slow TGSC crawl doesn't hold up PubChem lookups
+        self._rate_lock = threading.Lock()
+        self._next_request_at: dict[str, float] = {}
+        self._host_delay: dict[str, float] = {}  # Only hosts currently backed off
+        self._host_successes: dict[str, int] = {}
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
         
         # Session for connection reuse
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.HTTP_POOL_HOSTS,
+            pool_maxsize=self.HTTP_POOL_SIZE,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Headers shared by every request; requests merges these with the
+        # per-request User-Agent instead of each call rebuilding them
+        self.session.headers.update({
+            "Accept": "text/html,application/json,*/*",
+            "Accept-Language": "en-US,en;q=0.9",
+        })
     
     def _get_user_agent(self) -> str:
         """Get next User-Agent string."""
         if self.config.scraper.enable_user_agent_rotation:
-            if self.ua:
-                try:
-                    return self.ua.random
-                except Exception:
-                    pass
-            
-            # Fallback rotation
-            agent = self.FALLBACK_USER_AGENTS[self._ua_index]
-            self._ua_index = (self._ua_index + 1) % len(self.FALLBACK_USER_AGENTS)
-            return agent
+            return next(self._agents)
         
         return self.FALLBACK_USER_AGENTS[0]
     
-    def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        delay = self.config.scraper.delay_seconds
+    def _rate_limit(self, url: str) -> None:
+        """
+        Enforce rate limiting between requests to the same host.
+        
+        Thread-safe: each caller reserves the next free slot for the host
+        under the lock, then sleeps outside of it.
+        """
+        host = urlsplit(url).netloc
+        jitter = random.uniform(0, self.RATE_JITTER_FRACTION)
         
-        if elapsed < delay:
-            sleep_time = delay - elapsed
-            self.logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
+        with self._rate_lock:
+            delay = self._host_delay.get(host) or self._base_delay(host)
+            delay *= 1 + jitter
+            now = time.monotonic()
+            scheduled = max(now, self._next_request_at.get(host, 0.0))
+            self._next_request_at[host] = scheduled + delay
+        
+        sleep_time = scheduled - now
+        if sleep_time > 0:
+            self.logger.debug(f"Rate limiting {host}: sleeping {sleep_time:.2f}s")
             time.sleep(sleep_time)
+    
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Semaphore bounding the requests in flight to a URL's host."""
+        host = urlsplit(url).netloc
+        
+        with self._rate_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                limit = self.HOST_CONCURRENCY.get(
+                    host, self.config.scraper.host_concurrency
+                )
+                slot = self._host_slots[host] = threading.BoundedSemaphore(limit)
         
-        self._last_request_time = time.time()
+        return slot
+    
+    def _base_delay(self, host: str) -> float:
+        """Configured spacing between requests to a host."""
+        return self.HOST_DELAY_SECONDS.get(host, self.config.scraper.delay_seconds)
     
+    def _adapt_host_delay(self, url: str, response: requests.Response) -> None:
+        """
+        Back off a host that throttles us, and recover once it stops.
+        
+        On 429/503, or when the host's X-Throttling-Control header reports
+        Red/Black, the host's delay doubles and no request to it is
+        scheduled before Retry-After has passed. After
+        BACKOFF_RECOVERY_SUCCESSES unthrottled successes in a row it halves
+        again; a Yellow report holds the current delay. A response whose
+        X-RateLimit-* headers say the quota is spent holds the next request
+        until it resets, rather than waiting for the 429.
+        """
+        host = urlsplit(url).netloc
+        base = self._base_delay(host)
+        level = _throttle_level(response)
+        quota_reset = _quota_reset_seconds(response)
+        
+        with self._rate_lock:
+            current = self._host_delay.get(host, base)
+            
+            if response.status_code in (429, 503) or level >= 2:
+                delay = min(max(current * 2, 1.0), self.MAX_HOST_DELAY_SECONDS)
+                # Capped like the delay itself: a long Retry-After would
+                # otherwise park every thread waiting on this host
+                retry_after = min(
+                    _retry_after_seconds(response, delay),
+                    self.MAX_HOST_DELAY_SECONDS,
+                )
+                
+                self._host_delay[host] = delay
+                self._host_successes[host] = 0
+                self._next_request_at[host] = max(
+                    self._next_request_at.get(host, 0.0),
+                    time.monotonic() + retry_after,
+                )
+                reason = response.status_code if level < 2 else "X-Throttling-Control"
+                self.logger.warning(
+                    f"Throttled by {host} ({reason}): delay "
+                    f"{current:.2f}s -> {delay:.2f}s, pausing {retry_after:.0f}s"
+                )
+                return
+            
+            if quota_reset is not None:
+                self._next_request_at[host] = max(
+                    self._next_request_at.get(host, 0.0),
+                    time.monotonic() + min(quota_reset, self.MAX_HOST_DELAY_SECONDS),
+                )
+            
+            if host not in self._host_delay or level:
+                return
+            
+            successes = self._host_successes.get(host, 0) + 1
+            if successes < self.BACKOFF_RECOVERY_SUCCESSES:
+                self._host_successes[host] = successes
+                return
+            
+            delay = current / 2
+            self._host_successes[host] = 0
+            if delay <= base:
+                del self._host_delay[host]
+                delay = base
+            else:
+                self._host_delay[host] = delay
+        
+        self.logger.info(f"Recovering {host}: delay {current:.2f}s -> {delay:.2f}s")
+    
+    # reraise: callers handle requests.RequestException, so the last
+    # ConnectionError/Timeout must surface rather than tenacity's RetryError
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
+        wait=wait_exponential_jitter(initial=2, max=30),
         retry=retry_if_exception_type((requests.ConnectionError, requests.Timeout)),
+        reraise=True,
     )
     def _fetch(
         self, 
@@ -369,25 +764,11 @@ class FragranceScraper:
             cached = self.cache.get(url)
             if cached:
                 self.logger.debug(f"Cache hit: {url}")
-                # Create a mock response-like object
-                class CachedResponse:
-                    def __init__(self, data):
-                        self.text = data.get("text", "")
-                        self.status_code = data.get("status_code", 200)
-                        self.content = self.text.encode()
-                    def json(self):
-                        return json.loads(self.text)
-                    def raise_for_status(self):
-                        pass
-                return CachedResponse(cached)
-        
-        self._rate_limit()
-        
-        headers = {
-            "User-Agent": self._get_user_agent(),
-            "Accept": "text/html,application/json,*/*",
-            "Accept-Language": "en-US,en;q=0.9",
-        }
+                return _CachedResponse(cached)
+        
+        self._rate_limit(url)
+        
+        headers = {"User-Agent": self._get_user_agent()}
         
         if custom_headers:
             headers.update(custom_headers)
@@ -395,24 +776,29 @@ class FragranceScraper:
         self.logger.debug(f"Fetching: {url}")
         
         try:
-            response = self.session.get(
-                url,
-                headers=headers,
-                timeout=self.config.scraper.timeout_seconds,
-            )
-            
-            # Handle 429 specially
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 30))
-                self.logger.warning(f"Rate limited (429). Waiting {retry_after}s...")
-                time.sleep(retry_after)
-                # Retry once
+            with self._host_slot(url):
                 response = self.session.get(
                     url,
                     headers=headers,
                     timeout=self.config.scraper.timeout_seconds,
                 )
             
+            self._adapt_host_delay(url, response)
+            
+            # Throttled: retry after the host's backoff (doubled, jittered
+            # and at least Retry-After) has passed, a bounded number of times
+            for _ in range(self.THROTTLE_RETRIES):
+                if response.status_code not in (429, 503):
+                    break
+                self._rate_limit(url)
+                with self._host_slot(url):
+                    response = self.session.get(
+                        url,
+                        headers=headers,
+                        timeout=self.config.scraper.timeout_seconds,
+                    )
+                self._adapt_host_delay(url, response)
+            
             response.raise_for_status()
             
             # Cache successful responses
@@ -420,13 +806,21 @@ class FragranceScraper:
                 self.cache.set(url, {
                     "text": response.text,
                     "status_code": response.status_code,
+                    "encoding": response.encoding,
                 })
             
             return response
             
         except requests.HTTPError as e:
-            # Don't retry 404s
+            # Don't retry 404s; cache them too, so names a source doesn't
+            # know aren't looked up again on every run
             if e.response.status_code == 404:
+                if use_cache and self.config.scraper.cache_enabled:
+                    self.cache.set(url, {
+                        "text": e.response.text,
+                        "status_code": 404,
+                        "encoding": e.response.encoding,
+                    })
                 return e.response
             raise e
     
@@ -453,7 +847,7 @@ class FragranceScraper:
             search_url = CommonChemistryAPI.search_by_name(name)
             response = self._fetch(search_url)
             
-            data = response.json()
+            data = _json_body(response)
             results = data.get("results", [])
             
             if not results:
@@ -470,7 +864,7 @@ class FragranceScraper:
             # Step 2: Get detailed info
             detail_url = CommonChemistryAPI.get_detail(cas)
             detail_response = self._fetch(detail_url)
-            detail_data = detail_response.json()
+            detail_data = _json_body(detail_response)
             
             # Extract data
             profile = IngredientProfile(name=name)
@@ -511,7 +905,26 @@ class FragranceScraper:
         """
         Search The Good Scents Company for ingredient data.
         Now uses DuckDuckGo to find the direct page, bypassing the broken search form.
+        
+        The name -> TGSC page URL resolution is cached on disk, so repeat
+        lookups skip the search round-trip and fetch the (also cached) page.
         """
+        # Strategy 0: Previously resolved page URL, or a recent known miss
+        if self.config.scraper.cache_enabled:
+            cached = self.cache.get(self._tgsc_url_cache_key(name))
+            if cached and cached.get("miss"):
+                self.logger.debug(f"TGSC known miss for: {name}")
+                return None
+            if cached and cached.get("url"):
+                self.logger.debug(f"TGSC URL cache hit for: {name}")
+                result = self._fetch_and_parse_tgsc(cached["url"], name)
+                if result:
+                    return result
+        
+        # Set when TGSC's own search answered but had no match, as opposed
+        # to a failed request; only then is the miss worth remembering
+        tgsc_has_no_match = False
+        
         # Strategy 1: Direct TGSC Search (Most Reliable)
         try:
             self.logger.info(f"Searching TGSC directly: {name}")
@@ -526,35 +939,40 @@ class FragranceScraper:
                 "Content-Type": "application/x-www-form-urlencoded"
             }
             
-            self._rate_limit()
-            response = self.session.post(
-                search_url, 
-                data=data, 
-                headers=headers,
-                timeout=self.config.scraper.timeout_seconds
-            )
+            self._rate_limit(search_url)
             
-            if response.status_code == 200:
-                # Parse search results
-                soup = BeautifulSoup(response.text, "html.parser")
-                links = soup.find_all("a", href=True)
-                
-                tgsc_url = None
-                for link in links:
-                    href = link.get("href", "")
-                    if "data/rw" in href:
-                        tgsc_url = href
-                        break
+            # The slot is held until the streamed body is read or released,
+            # and dropped before the result page is fetched
+            with self._host_slot(search_url):
+                response = self.session.post(
+                    search_url, 
+                    data=data, 
+                    headers=headers,
+                    timeout=self.config.scraper.timeout_seconds,
+                    stream=True,
+                )
                 
-                # Fallback: Regex search if soup fails (e.g. link in JS or malformed HTML)
+                if response.status_code == 200:
+                    # Scan the body as it arrives and stop reading at the
+                    # first result link, without building a DOM
+                    tgsc_url, body = _scan_for_tgsc_link(response)
+                else:
+                    response.close()  # Streamed: release the connection unread
+            
+            if response.status_code == 200:
+                # Fallback: parse only result anchors (catches hrefs the raw
+                # scan can't see, e.g. entity-encoded or without .html)
                 if not tgsc_url:
-                    import re
-                    # Look for pattern data/rw followed by digits
-                    match = re.search(r'data/rw\d+\.html', response.text)
-                    if match:
-                        tgsc_url = match.group(0)
-                        self.logger.info(f"Found TGSC URL via Regex: {tgsc_url}")
-
+                    soup = BeautifulSoup(
+                        body,
+                        self.HTML_PARSER,
+                        parse_only=SoupStrainer("a", href=_TGSC_HREF_RE),
+                    )
+                    link = soup.find("a", href=True)
+                    if link:
+                        tgsc_url = link["href"]
+                        self.logger.info(f"Found TGSC URL via anchor: {tgsc_url}")
+                
                 if tgsc_url:
                     self.logger.info("Normalizing TGSC URL...")
                     # Normalize URL
@@ -572,18 +990,19 @@ class FragranceScraper:
                     else:
                          self.logger.warning("Direct Search fetched page but returned None (Parsing failed?)")
                 else:
-                    self.logger.warning(f"No data link found in TGSC Direct Search response (Length: {len(response.text)})")
+                    tgsc_has_no_match = True
+                    self.logger.warning(f"No data link found in TGSC Direct Search response (Length: {len(body)})")
             else:
                  self.logger.warning(f"TGSC Direct Search returned {response.status_code}")
                  
         except Exception as e:
-            import traceback
             self.logger.error(f"TGSC Direct Search CRASHED: {e}")
             self.logger.error(traceback.format_exc())
 
         # Strategy 2: DuckDuckGo Search
         try:
-            from duckduckgo_search import DDGS
+            if DDGS is None:
+                raise ImportError("duckduckgo_search is not installed")
             self.logger.info(f"Searching TGSC via DuckDuckGo: {name}")
             
             # Use 'lite' backend as it's often more lenient
@@ -600,11 +1019,12 @@ class FragranceScraper:
 
         # Strategy 3: Google Search (googlesearch-python)
         try:
-            from googlesearch import search
+            if google_search is None:
+                raise ImportError("googlesearch-python is not installed")
             self.logger.info(f"Searching TGSC via Google: {name}")
             
             # search() yields URLs
-            results = search(f"site:thegoodscentscompany.com {name} ingredient", num_results=3, advanced=True)
+            results = google_search(f"site:thegoodscentscompany.com {name} ingredient", num_results=3, advanced=True)
             for res in results:
                 # res might be a string or object depending on version
                 url = res.url if hasattr(res, 'url') else res
@@ -615,19 +1035,62 @@ class FragranceScraper:
             self.logger.warning(f"Google search failed: {e}")
             
         self.logger.warning(f"All TGSC search methods failed for: {name}")
+        
+        # Skip the search engine fallbacks for this name for a while
+        if tgsc_has_no_match and self.config.scraper.cache_enabled:
+            self.cache.set(
+                self._tgsc_url_cache_key(name),
+                {"miss": True},
+                ttl_seconds=self.TGSC_MISS_TTL_SECONDS,
+            )
         return None
 
     def _fetch_and_parse_tgsc(self, url: str, name: str) -> Optional[IngredientProfile]:
-        """Helper to fetch and parse a TGSC page."""
+        """Helper to fetch and parse a TGSC page, remembering the URL on success."""
         response = self._fetch(url)
         if response.status_code != 200:
             self.logger.warning(f"Failed to fetch TGSC page: {response.status_code}")
             return None
-        return self._parse_tgsc_page(response.text, name)
+        
+        profile = self._parse_tgsc_page(response.content, name)
+        if profile and self.config.scraper.cache_enabled:
+            self.cache.set(self._tgsc_url_cache_key(name), {"url": url})
+        return profile
+    
+    def forget_misses(self, name: str) -> None:
+        """
+        Forget cached "not found" answers for a name, so the next search
+        asks every source again instead of waiting for the entries to expire.
+        """
+        tgsc_key = self._tgsc_url_cache_key(name)
+        cached = self.cache.get(tgsc_key)
+        if cached and cached.get("miss"):
+            self.cache.delete(tgsc_key)
+        
+        # PubChem answers an unknown name with 404, Common Chemistry with
+        # an empty result list
+        pubchem_url = PubChemAPI.get_cids(name)
+        cached = self.cache.get(pubchem_url)
+        if cached and cached["status_code"] == 404:
+            self.cache.delete(pubchem_url)
+        
+        cas_url = CommonChemistryAPI.search_by_name(name)
+        cached = self.cache.get(cas_url)
+        if cached:
+            try:
+                if not _json_body(_CachedResponse(cached)).get("results"):
+                    self.cache.delete(cas_url)
+            except json.JSONDecodeError:
+                self.cache.delete(cas_url)
+    
+    @staticmethod
+    def _tgsc_url_cache_key(name: str) -> str:
+        """Cache key for a name's resolved TGSC page URL."""
+        return f"tgsc-url:{name.strip().lower()}"
     
     def _parse_tgsc_page(
         self, 
-        page_content: str, 
+        page_content: str | bytes, 
         name: str
     ) -> Optional[IngredientProfile]:
         """
@@ -635,169 +1098,143 @@ class FragranceScraper:
         """
         self.logger.info(f"Parsing TGSC page for '{name}' (Length: {len(page_content)})")
         try:
-            soup = BeautifulSoup(page_content, "html.parser")
+            # Parsed with lxml directly: only a few cells are read, so a
+            # BeautifulSoup tree over the whole page is wasted work
+            doc = lxml.html.fromstring(page_content)
             profile = IngredientProfile(name=name)
             
-            # Extract table data
-            tables = soup.find_all("table")
-            page_text = soup.get_text()
-            self.logger.info(f"Found {len(tables)} tables")
-            for table in tables:
-                rows = table.find_all("tr")
-                for row in rows:
-                    cells = row.find_all(["td", "th"])
-                    if len(cells) >= 2:
-                        label = cells[0].get_text(strip=True).lower()
-                        value = cells[1].get_text(strip=True)
-                        
-                        if "cas" in label and not profile.cas:
-                             # try to find cas pattern in value
-                             match = re.search(TGSCSelectors.CAS_PATTERN, value)
-                             if match:
-                                 profile.cas = match.group(1)
-                        
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["fema"]):
-                            profile.uses.append(f"FEMA {value}")
-                            
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["odor"]):
-                            if len(value) > 3:
-                                profile.odor_description = value
-                                
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["odor_type"]):
-                            if value:
-                                 profile.odor_family = value
-                                 
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["strength"]):
-                             profile.odor_strength = value
-                             
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["appearance"]):
-                             profile.appearance = value
+            # Extract table data. TGSC nests its layout tables, so walk the
+            # rows once rather than per table (which revisits inner rows),
+            # and stop as soon as every labelled field has been filled.
+            flavor_text = None
+            needed = set(TGSCSelectors.LABEL_PATTERNS)
+            for row in doc.iter("tr"):
+                cells = list(itertools.islice(row.iter("td", "th"), 2))
+                if len(cells) < 2:
+                    continue
+                
+                label = _cell_text(cells[0]).lower()
+                label_fields = _label_fields(label)
+                value = _cell_text(cells[1])
+                
+                if "cas" in label and not profile.cas:
+                     # try to find cas pattern in value
+                     match = _CAS_RE.search(value)
+                     if match:
+                         profile.cas = match.group(1)
+                         needed.discard("cas")
+                
+                elif "fema" in label_fields:
+                    profile.fema = f"FEMA {value}"
+                    profile.uses.append(profile.fema)
+                    needed.discard("fema")
+                    
+                elif "odor" in label_fields:
+                    if len(value) > 3:
+                        profile.odor_description = value
+                        needed.discard("odor")
                         
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["flash_point"]):
-                             profile.flash_point = value
-                             
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["molecular_weight"]):
-                             profile.molecular_weight = value
-                             
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["molecular_formula"]):
-                             profile.molecular_formula = value
-                             
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["synonyms"]):
-                            synonyms = [s.strip() for s in value.split(",")]
-                            profile.synonyms.extend(synonyms)
-                            
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["tenacity"]):
-                            profile.tenacity = value
-                            
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["logp"]):
-                            profile.logp = value
-                            
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["soluble"]):
-                            profile.soluble = value
-                            
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["shelf_life"]):
-                            profile.shelf_life = value
+                elif "odor_type" in label_fields:
+                    if value:
+                         profile.odor_family = value
+                         needed.discard("odor_type")
+                         
+                elif "strength" in label_fields:
+                     profile.odor_strength = self._normalize_strength(value)
+                     needed.discard("strength")
+                     
+                elif "appearance" in label_fields:
+                     profile.appearance = value
+                     needed.discard("appearance")
+                
+                elif "flash_point" in label_fields:
+                     profile.flash_point = value
+                     needed.discard("flash_point")
+                
+                elif "specific_gravity" in label_fields:
+                    profile.specific_gravity = value
+                    needed.discard("specific_gravity")
+                
+                elif "boiling_point" in label_fields:
+                    profile.boiling_point = value
+                    needed.discard("boiling_point")
+                     
+                elif "molecular_weight" in label_fields:
+                     profile.molecular_weight = value
+                     needed.discard("molecular_weight")
+                     
+                elif "molecular_formula" in label_fields:
+                     profile.molecular_formula = value
+                     needed.discard("molecular_formula")
+                     
+                elif "synonyms" in label_fields:
+                    synonyms = [s.strip() for s in value.split(",")]
+                    profile.synonyms.extend(synonyms)
+                    needed.discard("synonyms")
+                    
+                elif "tenacity" in label_fields:
+                    profile.tenacity = value
+                    needed.discard("tenacity")
+                    
+                elif "logp" in label_fields:
+                    profile.logp = value
+                    needed.discard("logp")
+                    
+                elif "soluble" in label_fields:
+                    profile.soluble = value
+                    needed.discard("soluble")
+                    
+                elif "shelf_life" in label_fields:
+                    profile.shelf_life = value
+                    needed.discard("shelf_life")
     
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["einecs"]):
-                            profile.einecs = value
+                elif "einecs" in label_fields:
+                    profile.einecs = value
+                    needed.discard("einecs")
     
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["reach"]):
-                            profile.reach = value
+                elif "reach" in label_fields:
+                    profile.reach = value
+                    needed.discard("reach")
+                
+                elif "flavor" in label_fields:
+                    if len(value) > 3 and not flavor_text:
+                        flavor_text = _WHITESPACE_RE.sub(' ', value)
+                        needed.discard("flavor")
+                
+                if not needed:
+                    break
+            
+            # Fallback to text parsing if tables failed (old logic). The
+            # page text is a walk of the whole DOM, so only build it then.
+            if not (profile.cas and profile.odor_description and flavor_text):
+                page_text = doc.text_content()
             
-            # Fallback to text parsing if tables failed (old logic)
             if not profile.cas:
                 # Extract CAS number - first match in page
-                cas_matches = re.findall(TGSCSelectors.CAS_PATTERN, page_text)
+                cas_matches = _CAS_RE.findall(page_text)
                 if cas_matches:
                     profile.cas = cas_matches[0]
             
             if not profile.odor_description:
                 # Extract odor description from text patterns
                 # TGSC format: "odor: citrus floral sweet woody"
-                odor_pattern = r'odor[:\s]+([a-zA-Z\s,]+?)(?:flavor|$|\n|\r|<)'
                 # ... (rest of regex logic is fine if needed, but table is preferred)
-                odor_match = re.search(odor_pattern, page_text, re.IGNORECASE)
+                odor_match = _ODOR_TEXT_RE.search(page_text)
                 if odor_match:
                     odor_text = odor_match.group(1).strip()
                     # Clean up the odor description
-                    odor_text = re.sub(r'\s+', ' ', odor_text)
+                    odor_text = _WHITESPACE_RE.sub(' ', odor_text)
                     if len(odor_text) > 3:
                         profile.odor_description = odor_text
             
             # Extract flavor description
-            flavor_pattern = r'flavor[:\s]+([a-zA-Z\s,]+?)(?:odor|$|\n|\r|<)'
-            flavor_match = re.search(flavor_pattern, page_text, re.IGNORECASE)
-            if flavor_match:
-                flavor_text = flavor_match.group(1).strip()
-                flavor_text = re.sub(r'\s+', ' ', flavor_text)
-                if len(flavor_text) > 3:
-                    profile.uses.append(f"Flavor: {flavor_text}")
-            
-            # Look for data in tables (fallback method)
-            tables = soup.find_all("table")
-            for table in tables:
-                rows = table.find_all("tr")
-                for row in rows:
-                    cells = row.find_all(["td", "th"])
-                    if len(cells) >= 2:
-                        label = cells[0].get_text(strip=True).lower()
-                        value = cells[1].get_text(strip=True)
-                        
-                        # Map common labels to fields
-                        if any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["cas"]):
-                            cas_match = re.search(TGSCSelectors.CAS_PATTERN, value)
-                            if cas_match:
-                                profile.cas = cas_match.group(1)
-                        
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["odor"]):
-                            if not profile.odor_description:
-                                profile.odor_description = value
-                        
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["odor_type"]):
-                            profile.odor_family = value
-                        
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["strength"]):
-                            profile.odor_strength = self._normalize_strength(value)
-                        
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["appearance"]):
-                            profile.appearance = value
-                        
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["flash_point"]):
-                            profile.flash_point = value
-                        
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["specific_gravity"]):
-                            profile.specific_gravity = value
-                        
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["boiling_point"]):
-                            profile.boiling_point = value
-                        
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["molecular_formula"]):
-                            profile.molecular_formula = value
-                        
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["molecular_weight"]):
-                            profile.molecular_weight = value
-                        
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["synonyms"]):
-                            synonyms = [s.strip() for s in value.split(",")]
-                            profile.synonyms.extend(synonyms)
-                            
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["tenacity"]):
-                            profile.tenacity = value
-                            
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["logp"]):
-                            profile.logp = value
-                            
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["soluble"]):
-                            profile.soluble = value
-                            
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["shelf_life"]):
-                            profile.shelf_life = value
-    
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["einecs"]):
-                            profile.einecs = value
-    
-                        elif any(lbl in label for lbl in TGSCSelectors.LABEL_PATTERNS["reach"]):
-                            profile.reach = value
+            if not flavor_text:
+                flavor_match = _FLAVOR_TEXT_RE.search(page_text)
+                if flavor_match:
+                    flavor_text = _WHITESPACE_RE.sub(' ', flavor_match.group(1).strip())
+            
+            if flavor_text and len(flavor_text) > 3:
+                profile.uses.append(f"Flavor: {flavor_text}")
             
             # Check if we found any useful data
             if profile.cas or profile.odor_description or profile.odor_family:
@@ -806,7 +1243,6 @@ class FragranceScraper:
             return None
     
         except Exception as e:
-            import traceback
             self.logger.error(f"TGSC Parsing CRASHED: {e}")
             self.logger.error(traceback.format_exc())
             return None
@@ -832,6 +1268,10 @@ class FragranceScraper:
         """
         Query PubChem API for chemical data.
         
+        Goes through batch_search_pubchem(), so a single name also uses
+        the light CID lookup instead of downloading the full compound
+        record just to read its CID.
+        
         Args:
             name: Compound name to search for
         
@@ -839,81 +1279,113 @@ class FragranceScraper:
             PubChemData or None if not found
         """
         self.logger.info(f"Searching PubChem for: {name}")
+        return self.batch_search_pubchem([name]).get(name)
+    
+    def batch_search_pubchem(self, names: list[str]) -> dict[str, Optional[PubChemData]]:
+        """
+        Query PubChem for many compounds at once.
         
-        # PubChem requires specific User-Agent with contact info
-        pubchem_headers = {
-            "User-Agent": "ParfumVault/1.0 (admin@parfumvault.local)"
-        }
+        PUG REST resolves names one at a time, but properties and synonyms
+        can be fetched for up to MAX_CIDS_PER_REQUEST CIDs per request, so
+        N names cost N + 2 requests per chunk instead of 3N.
         
-        try:
-            # Step 1: Search for compound by name
-            search_url = PubChemAPI.search_by_name(name)
-            response = self._fetch(search_url, custom_headers=pubchem_headers)
-            
-            if response.status_code == 404:
-                return None
-            
-            data = response.json()
-            compounds = data.get("PC_Compounds", [])
-            
-            if not compounds:
-                self.logger.warning(f"No PubChem data found for '{name}'")
-                return None
-            
-            compound = compounds[0]
-            cid = compound.get("id", {}).get("id", {}).get("cid")
-            
-            if not cid:
-                return None
-            
-            # Step 2: Get properties
-            props_url = PubChemAPI.get_properties(
-                cid, 
-                ["MolecularFormula", "MolecularWeight", "IUPACName"]
-            )
-            props_response = self._fetch(props_url, custom_headers=pubchem_headers)
-            props_data = props_response.json()
-            
-            properties = props_data.get("PropertyTable", {}).get("Properties", [{}])[0]
-            
-            # Step 3: Get synonyms
-            synonyms_url = PubChemAPI.get_synonyms(cid)
-            syn_response = self._fetch(synonyms_url, custom_headers=pubchem_headers)
-            syn_data = syn_response.json()
-            
-            synonyms = (
-                syn_data
-                .get("InformationList", {})
-                .get("Information", [{}])[0]
-                .get("Synonym", [])
-            )
-            
-            # Extract CAS from synonyms (often first one)
-            cas = None
-            for syn in synonyms[:20]:  # Check first 20
-                if re.match(TGSCSelectors.CAS_PATTERN, syn):
-                    cas = syn
-                    break
-            
-            result = PubChemData(
-                cid=cid,
-                name=name,
-                cas=cas,
-                molecular_formula=properties.get("MolecularFormula"),
-                molecular_weight=str(properties.get("MolecularWeight", "")),
-                iupac_name=properties.get("IUPACName"),
-                synonyms=synonyms[:50],  # Limit synonyms
-            )
-            
-            self.logger.info(f"Found PubChem data for '{name}' (CID: {cid})")
-            return result
-            
-        except requests.RequestException as e:
-            self.logger.error(f"PubChem request failed for '{name}': {e}")
-            return None
-        except (json.JSONDecodeError, KeyError) as e:
-            self.logger.error(f"PubChem parsing error for '{name}': {e}")
-            return None
+        Args:
+            names: Compound names to search for
+        
+        Returns:
+            Mapping of name to PubChemData, or None if PubChem has no
+            match. Names whose lookup failed (network/parse errors) are
+            left out so callers can retry them.
+        """
+        pubchem_headers = PubChemAPI.HEADERS
+        results: dict[str, Optional[PubChemData]] = {}
+        cids: dict[str, int] = {}
+        
+        # Step 1: Resolve names to CIDs. Lookups overlap on a few threads:
+        # the per-host limiter still spaces them, but each request's round
+        # trip no longer waits for the previous one to finish.
+        def resolve(name: str) -> None:
+            try:
+                response = self._fetch(PubChemAPI.get_cids(name), custom_headers=pubchem_headers)
+                if response.status_code == 404:
+                    results[name] = None
+                    return
+                
+                found = _json_body(response).get("IdentifierList", {}).get("CID", [])
+                if found and found[0]:
+                    cids[name] = found[0]
+                else:
+                    results[name] = None
+            except (requests.RequestException, json.JSONDecodeError) as e:
+                self.logger.error(f"PubChem CID lookup failed for '{name}': {e}")
+        
+        unique_names = list(dict.fromkeys(names))
+        if len(unique_names) == 1:
+            resolve(unique_names[0])
+        else:
+            with ThreadPoolExecutor(
+                max_workers=self.PUBCHEM_CID_WORKERS,
+                thread_name_prefix="pubchem-cid",
+            ) as executor:
+                list(executor.map(resolve, unique_names))
+        
+        # Steps 2 + 3: Properties and synonyms for all CIDs, chunked
+        unique_cids = list(dict.fromkeys(cids.values()))
+        properties: dict[int, dict] = {}
+        synonyms: dict[int, list[str]] = {}
+        
+        for i in range(0, len(unique_cids), PubChemAPI.MAX_CIDS_PER_REQUEST):
+            chunk = unique_cids[i:i + PubChemAPI.MAX_CIDS_PER_REQUEST]
+            try:
+                props_url = PubChemAPI.get_properties(chunk, PubChemAPI.PROPERTIES)
+                props_data = _json_body(self._fetch(props_url, custom_headers=pubchem_headers))
+                for entry in props_data.get("PropertyTable", {}).get("Properties", []):
+                    properties[entry.get("CID")] = entry
+                
+                syn_url = PubChemAPI.get_synonyms(chunk)
+                syn_data = _json_body(self._fetch(syn_url, custom_headers=pubchem_headers))
+                for entry in syn_data.get("InformationList", {}).get("Information", []):
+                    synonyms[entry.get("CID")] = entry.get("Synonym", [])
+            except (requests.RequestException, json.JSONDecodeError) as e:
+                self.logger.error(f"PubChem batch request failed for CIDs {chunk}: {e}")
+                for cid in chunk:
+                    properties.pop(cid, None)  # Leave the whole chunk out
+        
+        for name, cid in cids.items():
+            if cid in properties:
+                results[name] = self._build_pubchem_data(
+                    name, cid, properties[cid], synonyms.get(cid, [])
+                )
+        
+        found_count = sum(1 for data in results.values() if data)
+        self.logger.info(f"PubChem batch: {found_count}/{len(names)} compounds found")
+        return results
+    
+    def _build_pubchem_data(
+        self,
+        name: str,
+        cid: int,
+        properties: dict[str, Any],
+        synonyms: list[str]
+    ) -> PubChemData:
+        """Build PubChemData from PUG REST property and synonym records."""
+        # PubChem repeats synonyms that differ only in source
+        synonyms = list(dict.fromkeys(synonyms))
+        
+        # Extract CAS from synonyms (often first one): one search over the
+        # first 20, each on its own line, instead of a match per synonym
+        match = _CAS_SYNONYM_RE.search("\n".join(synonyms[:20]))
+        cas = match.group(1) if match else None
+        
+        return PubChemData(
+            cid=cid,
+            name=name,
+            cas=cas,
+            molecular_formula=properties.get("MolecularFormula"),
+            molecular_weight=str(properties.get("MolecularWeight", "")),
+            iupac_name=properties.get("IUPACName"),
+            synonyms=synonyms[:50],  # Limit synonyms
+        )
     
     # -------------------------------------------------------------------------
     # IFRA Data (placeholder for future implementation)